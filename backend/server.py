@@ -3,31 +3,74 @@ from fastapi import (
     Depends,
     FastAPI,
     HTTPException,
+    Request,
+    Response,
     WebSocket,
     WebSocketDisconnect,
 )
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import CursorType, ReplaceOne, ReturnDocument, UpdateOne, monitoring
+from pymongo.errors import CollectionInvalid, DuplicateKeyError, OperationFailure
+import asyncio
+import base64
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import importlib.util
+import json
 import os
 import logging
+import sys
+import threading
+import time
 from pathlib import Path
+from urllib.parse import urlencode
 from pydantic import BaseModel, ConfigDict, EmailStr
-from typing import List, Optional, Dict
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Dict, Sequence, Tuple
+from array import array
 import uuid
 from datetime import datetime, timezone, timedelta
 import jwt
 import bcrypt
 import httpx
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - scoring falls back to pure Python
+    np = None
+
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Per-request MongoDB command counts, filled in by CommandCounter
+request_db_commands: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "request_db_commands", default=None
+)
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts the MongoDB commands issued while serving the current request"""
+
+    def started(self, event):
+        counts = request_db_commands.get()
+        if counts is not None:
+            counts[event.command_name] = counts.get(event.command_name, 0) + 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[CommandCounter()])
 db = client[os.environ['DB_NAME']]
 
 # Create the main app
@@ -49,9 +92,62 @@ JWT_SECRET = os.environ.get('JWT_SECRET', 'kickpredict-secret-key-2025')
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Verified-token cache
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', '10000'))
+TOKEN_CACHE_TTL = float(os.environ.get('TOKEN_CACHE_TTL', '300'))
+
+# Bulk prediction submission
+PREDICTION_BATCH_LIMIT = int(os.environ.get('PREDICTION_BATCH_LIMIT', '128'))
+
+# Prediction write-behind buffer (0 writes through)
+PREDICTION_WRITE_WINDOW = float(os.environ.get('PREDICTION_WRITE_WINDOW', '1.0'))
+
+# Pagination
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '1000'))
+
+# Response cache
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', '1024'))
+# Backstop for workers that miss an invalidation (e.g. the memory bus)
+RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', '5'))
+
+# Match schedule entries are re-read after this many seconds
+MATCH_SCHEDULE_TTL = float(os.environ.get('MATCH_SCHEDULE_TTL', '60'))
+
+# Password hashing
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_QUEUE_LIMIT = int(os.environ.get('PASSWORD_QUEUE_LIMIT', '256'))
+
 # Football Data API
 FOOTBALL_DATA_API_KEY = os.environ.get('FOOTBALL_DATA_API_KEY', '')
-FOOTBALL_DATA_BASE_URL = "https://api.football-data.org/v4"
+FOOTBALL_DATA_BASE_URL = os.environ.get(
+    'FOOTBALL_DATA_BASE_URL', "https://api.football-data.org/v4"
+)
+FOOTBALL_DATA_HTTP2 = os.environ.get('FOOTBALL_DATA_HTTP2', 'false').lower() == 'true'
+FOOTBALL_DATA_REQUESTS_PER_MINUTE = int(
+    os.environ.get('FOOTBALL_DATA_REQUESTS_PER_MINUTE', '10')
+)
+FOOTBALL_DATA_MAX_RETRIES = int(os.environ.get('FOOTBALL_DATA_MAX_RETRIES', '3'))
+
+# Live score poller
+LIVE_POLLER_ENABLED = os.environ.get('LIVE_POLLER_ENABLED', 'true').lower() == 'true'
+LIVE_POLL_INTERVAL = float(os.environ.get('LIVE_POLL_INTERVAL', '15'))
+IDLE_POLL_INTERVAL = float(os.environ.get('IDLE_POLL_INTERVAL', '3600'))
+KICKOFF_WINDOW_MINUTES = int(os.environ.get('KICKOFF_WINDOW_MINUTES', '30'))
+
+# User profile cache
+USER_PROFILE_CACHE_TTL = float(os.environ.get('USER_PROFILE_CACHE_TTL', '60'))
+USER_PROFILE_CACHE_SIZE = int(os.environ.get('USER_PROFILE_CACHE_SIZE', '10000'))
+
+# Scoring engine
+SCORING_BATCH_SIZE = int(os.environ.get('SCORING_BATCH_SIZE', '1000'))
+SCORING_WORKERS = int(os.environ.get('SCORING_WORKERS', '4'))
+
+# WebSocket fan-out
+WS_SEND_QUEUE_SIZE = int(os.environ.get('WS_SEND_QUEUE_SIZE', '64'))
+WS_PUBSUB_BACKEND = os.environ.get('WS_PUBSUB_BACKEND', 'memory')
+WS_CHANGE_LOG_SIZE = int(os.environ.get('WS_CHANGE_LOG_SIZE', '1000'))
+WS_EVENTS_COLLECTION_BYTES = int(os.environ.get('WS_EVENTS_COLLECTION_BYTES', str(16 * 1024 * 1024)))
 
 # Security
 security = HTTPBearer()
@@ -93,6 +189,9 @@ class PredictionCreate(BaseModel):
     away_score: int
     is_joker: bool = False
 
+class PredictionBatchCreate(BaseModel):
+    predictions: List[PredictionCreate]
+
 class PredictionResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str
@@ -125,11 +224,63 @@ class GroupResponse(BaseModel):
 # ==================== AUTH HELPERS ====================
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed.encode())
 
+class PasswordHasher:
+    """Runs bcrypt work on a small dedicated thread pool.
+
+    Hashing takes hundreds of milliseconds of CPU, so it must not run on
+    the event loop. The pool is size-limited so a login spike cannot
+    starve other threads, and requests beyond ``queue_limit`` waiting jobs
+    are rejected with 503 instead of piling up.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.queue_limit = queue_limit
+        self.metrics = {
+            "workers": workers, "queued": 0, "in_flight": 0, "max_queued": 0,
+            "completed": 0, "rejected": 0
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+        self._lock = threading.Lock()
+
+    def _job(self, fn: Callable, *args):
+        with self._lock:
+            self.metrics["queued"] -= 1
+            self.metrics["in_flight"] += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.metrics["in_flight"] -= 1
+                self.metrics["completed"] += 1
+
+    async def _run(self, fn: Callable, *args):
+        with self._lock:
+            if self.metrics["queued"] >= self.queue_limit:
+                self.metrics["rejected"] += 1
+                raise HTTPException(status_code=503, detail="Server busy, please retry")
+            self.metrics["queued"] += 1
+            self.metrics["max_queued"] = max(self.metrics["max_queued"], self.metrics["queued"])
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._job, fn, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_QUEUE_LIMIT)
+
 def create_token(user_id: str) -> str:
     payload = {
         "sub": user_id,
@@ -138,9 +289,51 @@ def create_token(user_id: str) -> str:
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
+USER_IDENTITY_PROJECTION = {
+    "_id": 0, "id": 1, "email": 1, "username": 1, "avatar": 1, "created_at": 1
+}
+
+class TokenCache:
+    """LRU cache of verified tokens and the identity of their user.
+
+    Entries live at most ``ttl`` seconds and never past the token's own
+    ``exp``, so a cached token expires exactly when decoding it would fail.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, token: str) -> Optional[dict]:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return user
+
+    def set(self, token: str, user: dict, exp: float):
+        lifetime = min(self.ttl, exp - time.time())
+        if lifetime <= 0:
+            return
+        if token not in self._entries and len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+        self._entries[token] = (time.monotonic() + lifetime, user)
+        self._entries.move_to_end(token)
+
+token_cache = TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
+    """Identity fields of the caller (stats are read by the endpoints that need them)"""
+    cached = token_cache.get(credentials.credentials)
+    if cached is not None:
+        return dict(cached)
     try:
         payload = jwt.decode(
             credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM]
@@ -148,15 +341,73 @@ async def get_current_user(
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
-        user = await db.users.find_one({"id": user_id}, {"_id": 0, "password": 0})
+        user = await db.users.find_one({"id": user_id}, USER_IDENTITY_PROJECTION)
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
-        return user
+        token_cache.set(credentials.credentials, user, payload["exp"])
+        return dict(user)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# ==================== USER ENRICHMENT ====================
+
+class UserProfileCache:
+    """TTL cache of the public user fields shown next to predictions and ranks"""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: Dict[str, Tuple[float, dict]] = {}
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[Dict[str, dict], List[str]]:
+        now = time.monotonic()
+        found: Dict[str, dict] = {}
+        missing: List[str] = []
+        for user_id in user_ids:
+            entry = self._entries.get(user_id)
+            if entry and entry[0] > now:
+                found[user_id] = entry[1]
+            else:
+                missing.append(user_id)
+        return found, missing
+
+    def set(self, user_id: str, profile: dict):
+        if user_id not in self._entries and len(self._entries) >= self.max_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[user_id] = (time.monotonic() + self.ttl, profile)
+
+    def invalidate(self, user_id: Optional[str] = None):
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+user_profiles = UserProfileCache(USER_PROFILE_CACHE_TTL, USER_PROFILE_CACHE_SIZE)
+
+async def get_user_profiles(user_ids: Iterable[str]) -> Dict[str, dict]:
+    """Resolve id/username/avatar for many users with at most one $in query"""
+    profiles, missing = user_profiles.get_many(set(user_ids))
+    if missing:
+        async for user in db.users.find(
+            {"id": {"$in": missing}},
+            {"_id": 0, "id": 1, "username": 1, "avatar": 1}
+        ):
+            user_profiles.set(user["id"], user)
+            profiles[user["id"]] = user
+    return profiles
+
+async def enrich_with_users(rows: List[dict], key: str = "user_id") -> List[dict]:
+    """Attach username and avatar to every row that carries a user id"""
+    profiles = await get_user_profiles(row[key] for row in rows)
+    for row in rows:
+        profile = profiles.get(row[key], {})
+        row["username"] = profile.get("username", "Unknown")
+        row["avatar"] = profile.get("avatar")
+    return rows
+
 # ==================== AUTH ENDPOINTS ====================
 
 @api_router.post("/auth/register", response_model=TokenResponse)
@@ -177,7 +428,7 @@ async def register(user_data: UserCreate):
         "id": user_id,
         "email": user_data.email,
         "username": user_data.username,
-        "password": hash_password(user_data.password),
+        "password": await password_hasher.hash(user_data.password),
         "avatar": None,
         "total_points": 0,
         "exact_scores": 0,
@@ -201,7 +452,7 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email})
-    if not user or not verify_password(credentials.password, user["password"]):
+    if not user or not await password_hasher.verify(credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_token(user["id"])
@@ -233,29 +484,313 @@ async def get_me(current_user: dict = Depends(get_current_user)):
 
 # ==================== FOOTBALL DATA API ====================
 
+class TokenBucket:
+    """Async token bucket that spaces requests to a per-minute quota"""
+
+    def __init__(self, requests_per_minute: int):
+        self.capacity = max(requests_per_minute, 1)
+        self.rate = self.capacity / 60.0
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def drain(self, seconds: float):
+        """Empty the bucket so the next token is available after ``seconds``"""
+        self._refill()
+        self.tokens = 1.0 - seconds * self.rate
+
+class FootballDataClient:
+    """Pooled, rate-limited football-data.org client with conditional requests"""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        requests_per_minute: int = 10,
+        http2: bool = False,
+        max_retries: int = 3,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.base_url = base_url
+        self.api_key = api_key
+        self.http2 = http2
+        self.max_retries = max_retries
+        self.transport = transport
+        self.bucket = TokenBucket(requests_per_minute)
+        self.metrics = {"requests": 0, "not_modified": 0, "rate_limited": 0, "errors": 0}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._validators: Dict[str, Dict] = {}
+
+    async def start(self):
+        if self._client is not None:
+            return
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed")
+            http2 = False
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"X-Auth-Token": self.api_key},
+            timeout=30.0,
+            http2=http2,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            transport=self.transport
+        )
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, endpoint: str) -> Optional[Dict]:
+        await self.start()
+        cached = self._validators.get(endpoint)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            self.metrics["requests"] += 1
+            try:
+                response = await self._client.get(endpoint, headers=headers)
+            except httpx.HTTPError as e:
+                self.metrics["errors"] += 1
+                logger.error(f"Football API request failed: {e}")
+                return None
+
+            if response.status_code == 200:
+                try:
+                    data = response.json()
+                except ValueError as e:
+                    self.metrics["errors"] += 1
+                    logger.error(f"Football API returned invalid JSON: {e}")
+                    return None
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._validators[endpoint] = {
+                        "etag": etag, "last_modified": last_modified, "data": data
+                    }
+                return data
+            if response.status_code == 304 and cached:
+                self.metrics["not_modified"] += 1
+                return cached["data"]
+            if response.status_code == 429 and attempt < self.max_retries:
+                self.metrics["rate_limited"] += 1
+                wait = self._retry_after(response)
+                logger.warning(f"Football API rate limited, retrying in {wait:.0f}s")
+                self.bucket.drain(wait)
+                continue
+
+            self.metrics["errors"] += 1
+            logger.error(f"Football API error: {response.status_code}")
+            return None
+        return None
+
+    def _retry_after(self, response: httpx.Response) -> float:
+        # football-data.org reports the seconds until its counter resets
+        for header in ("Retry-After", "X-RequestCounter-Reset"):
+            try:
+                return max(float(response.headers[header]), 1.0)
+            except (KeyError, ValueError):
+                continue
+        return 60.0 / self.bucket.capacity
+
+football_data = FootballDataClient(
+    FOOTBALL_DATA_BASE_URL,
+    FOOTBALL_DATA_API_KEY,
+    requests_per_minute=FOOTBALL_DATA_REQUESTS_PER_MINUTE,
+    http2=FOOTBALL_DATA_HTTP2,
+    max_retries=FOOTBALL_DATA_MAX_RETRIES
+)
+
 async def fetch_football_data(endpoint: str) -> Optional[Dict]:
     if not FOOTBALL_DATA_API_KEY:
         logger.warning("Football Data API key not configured")
         return None
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{FOOTBALL_DATA_BASE_URL}{endpoint}",
-                headers={"X-Auth-Token": FOOTBALL_DATA_API_KEY},
-                timeout=30.0
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"Football API error: {response.status_code}")
-                return None
-        except Exception as e:
-            logger.error(f"Football API request failed: {e}")
+    return await football_data.get(endpoint)
+
+# ==================== RESPONSE CACHE ====================
+
+class ResponseCache:
+    """Serialized JSON bodies and their ETags for read-mostly endpoints"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.metrics = {"hits": 0, "misses": 0, "not_modified": 0}
+        self._entries: Dict[str, Tuple[float, Tuple[bytes, str, Dict[str, str]]]] = {}
+        # Bumped by invalidate() so results loaded before it are not stored
+        self.generation = 0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str, Dict[str, str]]]:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del self._entries[key]
             return None
+        return cached[1]
+
+    def set(
+        self, key: str, body: bytes, headers: Dict[str, str], generation: int
+    ) -> Tuple[bytes, str, Dict[str, str]]:
+        entry = (body, f'"{hashlib.sha1(body).hexdigest()}"', headers)
+        if generation != self.generation:
+            # Invalidated while loading: serve the result but do not keep it
+            return entry
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, entry)
+        return entry
+
+    def invalidate(self):
+        self.generation += 1
+        self._entries.clear()
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+async def cached_json_response(request: Request, loader: Callable[[], Awaitable]) -> Response:
+    """Serve ``loader()`` from the response cache, answering If-None-Match with 304.
+
+    Entries are keyed on the path and the sorted query parameters and are
+    dropped whenever match data changes (see ``invalidate_match_responses``)
+    or after ``RESPONSE_CACHE_TTL`` seconds.
+    A loader may return ``(content, headers)`` to cache extra headers.
+    """
+    key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+    entry = response_cache.get(key)
+    if entry is None:
+        response_cache.metrics["misses"] += 1
+        generation = response_cache.generation
+        content = await loader()
+        headers = {}
+        if isinstance(content, tuple):
+            content, headers = content
+        body = json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode()
+        entry = response_cache.set(key, body, headers, generation)
+    else:
+        response_cache.metrics["hits"] += 1
+    body, etag, headers = entry
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        response_cache.metrics["not_modified"] += 1
+        return Response(status_code=304, headers={"ETag": etag, **headers})
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag, **headers}
+    )
+
+# ==================== PAGINATION ====================
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Only scalars: the values go straight into query clauses, so an object
+    # such as {"$ne": null} would be read as an operator
+    if not isinstance(values, list) or not all(
+        value is None or isinstance(value, (str, int, float)) for value in values
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def keyset_query(query: dict, sort: List[Tuple[str, int]], cursor: Optional[str]) -> dict:
+    """Restrict ``query`` to documents after ``cursor`` in ascending ``sort`` order"""
+    if not cursor:
+        return query
+    values = decode_cursor(cursor)
+    if len(values) != len(sort):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    after = []
+    for idx, (field, _) in enumerate(sort):
+        clause = {sort[i][0]: values[i] for i in range(idx)}
+        clause[field] = {"$gt": values[idx]}
+        after.append(clause)
+    return {"$and": [query, {"$or": after}]}
+
+async def fetch_page(
+    collection,
+    query: dict,
+    sort: List[Tuple[str, int]],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[dict], Dict[str, str]]:
+    """One keyset page plus an ``X-Next-Cursor`` header when more remain"""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    items = await collection.find(
+        keyset_query(query, sort, cursor), {"_id": 0}
+    ).sort(sort).limit(limit + 1).to_list(limit + 1)
+    headers = {}
+    if len(items) > limit:
+        items = items[:limit]
+        headers["X-Next-Cursor"] = encode_cursor([items[-1][field] for field, _ in sort])
+    return items, headers
+
+def wants_ndjson(request: Request) -> bool:
+    return "application/x-ndjson" in request.headers.get("accept", "")
+
+def ndjson_response(
+    collection,
+    query: dict,
+    sort: List[Tuple[str, int]],
+    cursor: Optional[str] = None,
+    enrich: Optional[Callable[[List[dict]], Awaitable]] = None,
+    chunk_size: int = 500
+) -> StreamingResponse:
+    """Stream every matching document as NDJSON straight off the Motor cursor"""
+    query = keyset_query(query, sort, cursor)
+
+    async def lines():
+        chunk = []
+        async for doc in collection.find(query, {"_id": 0}, batch_size=chunk_size).sort(sort):
+            chunk.append(doc)
+            if len(chunk) >= chunk_size:
+                yield await encode_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield await encode_chunk(chunk)
+
+    async def encode_chunk(chunk: List[dict]) -> str:
+        if enrich:
+            await enrich(chunk)
+        return "".join(json.dumps(jsonable_encoder(doc)) + "\n" for doc in chunk)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 @api_router.get("/competitions")
-async def get_competitions():
+async def get_competitions(request: Request):
+    return await cached_json_response(request, load_competitions)
+
+async def load_competitions():
     # Return World Cup competition info
     competitions = await db.competitions.find({}, {"_id": 0}).to_list(100)
     if not competitions:
@@ -269,17 +804,35 @@ async def get_competitions():
             "current_season": 2022,
             "stages": ["GROUP_STAGE", "LAST_16", "QUARTER_FINALS", "SEMI_FINALS", "THIRD_PLACE", "FINAL"]
         }
-        await db.competitions.insert_one(wc)
+        await db.competitions.insert_one(dict(wc))
         competitions = [wc]
     return competitions
 
 @api_router.get("/matches")
 async def get_matches(
+    request: Request,
     competition_id: Optional[int] = 2000,
     stage: Optional[str] = None,
     group: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: int = 200,
+    cursor: Optional[str] = None
 ):
+    query = match_list_query(competition_id, stage, group, status)
+    if wants_ndjson(request):
+        return ndjson_response(db.matches, query, MATCH_LIST_SORT, cursor)
+    return await cached_json_response(
+        request, lambda: fetch_page(db.matches, query, MATCH_LIST_SORT, limit, cursor)
+    )
+
+MATCH_LIST_SORT = [("utc_date", 1), ("id", 1)]
+
+def match_list_query(
+    competition_id: Optional[int],
+    stage: Optional[str],
+    group: Optional[str],
+    status: Optional[str]
+) -> dict:
     query = {}
     if competition_id:
         query["competition_id"] = competition_id
@@ -289,12 +842,13 @@ async def get_matches(
         query["group"] = group
     if status:
         query["status"] = status
-    
-    matches = await db.matches.find(query, {"_id": 0}).sort("utc_date", 1).to_list(200)
-    return matches
+    return query
 
 @api_router.get("/matches/{match_id}")
-async def get_match(match_id: int):
+async def get_match(request: Request, match_id: int):
+    return await cached_json_response(request, lambda: load_match(match_id))
+
+async def load_match(match_id: int):
     match = await db.matches.find_one({"id": match_id}, {"_id": 0})
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -303,12 +857,26 @@ async def get_match(match_id: int):
 @api_router.post("/matches/sync")
 async def sync_matches(current_user: dict = Depends(get_current_user)):
     """Sync matches from Football Data API"""
+    async with match_sync_lock:
+        result = await sync_competition_matches()
+        if result is None:
+            # Use mock data if API unavailable
+            return await generate_mock_matches()
+    return result
+
+@api_router.get("/matches/sync/status")
+async def get_sync_status():
+    return {**live_poller.metrics, "scoring": scoring_queue.metrics}
+
+match_sync_lock = asyncio.Lock()
+
+async def sync_competition_matches() -> Optional[dict]:
+    """Fetch the World Cup matches and apply the changes; None if unavailable"""
     data = await fetch_football_data("/competitions/WC/matches")
     if not data:
-        # Use mock data if API unavailable
-        return await generate_mock_matches()
+        return None
     
-    matches_synced = 0
+    match_docs = []
     for match in data.get("matches", []):
         match_doc = {
             "id": match["id"],
@@ -333,13 +901,12 @@ async def sync_matches(current_user: dict = Depends(get_current_user)):
             "score": {
                 "home": match["score"]["fullTime"]["home"],
                 "away": match["score"]["fullTime"]["away"]
-            },
-            "last_updated": datetime.now(timezone.utc).isoformat()
+            }
         }
-        await db.matches.update_one({"id": match["id"]}, {"$set": match_doc}, upsert=True)
-        matches_synced += 1
+        match_docs.append(match_doc)
     
-    return {"message": f"Synced {matches_synced} matches"}
+    changes = await apply_match_changes(match_docs)
+    return {"message": f"Synced {len(match_docs)} matches", "changes": changes}
 
 async def generate_mock_matches():
     """Generate mock World Cup matches for demo"""
@@ -356,8 +923,10 @@ async def generate_mock_matches():
     }
     
     match_id = 100000
-    base_date = datetime.now(timezone.utc)
-    matches_created = 0
+    # Anchor kickoffs to the start of the day so repeated syncs produce the
+    # same documents and apply_match_changes finds nothing to rewrite
+    base_date = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    match_docs = []
     
     # Group stage matches
     for group_letter, teams in teams_per_group.items():
@@ -385,12 +954,10 @@ async def generate_mock_matches():
                         "short_name": teams[j][1],
                         "crest": f"https://flagcdn.com/w80/{teams[j][1].lower()[:2]}.png"
                     },
-                    "score": {"home": None, "away": None},
-                    "last_updated": datetime.now(timezone.utc).isoformat()
+                    "score": {"home": None, "away": None}
                 }
-                await db.matches.update_one({"id": match_id}, {"$set": match_doc}, upsert=True)
+                match_docs.append(match_doc)
                 match_id += 1
-                matches_created += 1
                 matchday = (matchday % 3) + 1
     
     # Knockout matches (placeholders)
@@ -425,77 +992,730 @@ async def generate_mock_matches():
                     "short_name": "TBD",
                     "crest": ""
                 },
-                "score": {"home": None, "away": None},
-                "last_updated": datetime.now(timezone.utc).isoformat()
+                "score": {"home": None, "away": None}
             }
-            await db.matches.update_one({"id": match_id}, {"$set": match_doc}, upsert=True)
+            match_docs.append(match_doc)
             match_id += 1
-            matches_created += 1
     
-    return {"message": f"Generated {matches_created} mock matches"}
+    changes = await apply_match_changes(match_docs)
+    return {"message": f"Generated {len(match_docs)} mock matches", "changes": changes}
+
+def match_fingerprint(match_doc: dict) -> str:
+    """Stable hash of the synced fields of a match document"""
+    payload = {
+        key: value for key, value in match_doc.items()
+        if key not in ("last_updated", "fingerprint")
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()
+
+async def apply_match_changes(match_docs: List[dict]) -> dict:
+    """Upsert and broadcast only the changed matches; returns the change set"""
+    changes = {
+        "new": [], "status_changed": [], "score_changed": [], "updated": [],
+        "unchanged": 0
+    }
+    if not match_docs:
+        return changes
+    
+    stored = {}
+    async for match in db.matches.find(
+        {"id": {"$in": [doc["id"] for doc in match_docs]}},
+        {"_id": 0, "id": 1, "fingerprint": 1, "status": 1, "score": 1}
+    ):
+        stored[match["id"]] = match
+    
+    now = datetime.now(timezone.utc).isoformat()
+    ops = []
+    changed: Dict[int, List[dict]] = {}
+    for doc in match_docs:
+        fingerprint = match_fingerprint(doc)
+        previous = stored.get(doc["id"])
+        if previous and previous.get("fingerprint") == fingerprint:
+            changes["unchanged"] += 1
+            continue
+        
+        doc = {**doc, "fingerprint": fingerprint, "last_updated": now}
+        ops.append(UpdateOne({"id": doc["id"]}, {"$set": doc}, upsert=True))
+        changed.setdefault(doc["competition_id"], []).append(doc)
+        if previous is None:
+            changes["new"].append(doc["id"])
+            continue
+        status_changed = previous.get("status") != doc["status"]
+        score_changed = previous.get("score") != doc["score"]
+        if status_changed:
+            changes["status_changed"].append(doc["id"])
+        if score_changed:
+            changes["score_changed"].append(doc["id"])
+        if not (status_changed or score_changed):
+            changes["updated"].append(doc["id"])
+    
+    if ops:
+        await db.matches.bulk_write(ops, ordered=False)
+    
+    # Settle newly finished matches and re-score corrected results
+    for doc in match_docs:
+        previous = stored.get(doc["id"]) or {}
+        if "FINISHED" not in (doc["status"], previous.get("status")):
+            continue
+        if doc["id"] in changes["new"] or doc["id"] in changes["status_changed"] \
+                or doc["id"] in changes["score_changed"]:
+            scoring_queue.enqueue(doc["id"])
+    
+    for competition_id, matches in changed.items():
+        await publish_match_changes(competition_id, matches, "matches_updated")
+    return changes
+
+# ==================== LIVE SCORE POLLER ====================
+
+LIVE_STATUSES = ["IN_PLAY", "PAUSED", "EXTRA_TIME", "PENALTY_SHOOTOUT"]
+UPCOMING_STATUSES = ["SCHEDULED", "TIMED"]
+
+async def acquire_lease(name: str, holder: str, seconds: float) -> bool:
+    """Take or renew a lease shared by every worker; False if another holds it"""
+    now = datetime.now(timezone.utc)
+    try:
+        await db.counters.find_one_and_update(
+            {"_id": f"lease:{name}", "$or": [{"holder": holder}, {"expires_at": {"$lt": now}}]},
+            {"$set": {"holder": holder, "expires_at": now + timedelta(seconds=seconds)}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # The lease exists, is held by someone else and has not expired
+        return False
+    return True
+
+async def release_lease(name: str, holder: str):
+    await db.counters.delete_one({"_id": f"lease:{name}", "holder": holder})
+
+class LiveScorePoller:
+    """Adaptive background sync; one worker at a time polls, via a lease"""
+
+    def __init__(self, live_interval: float, idle_interval: float, kickoff_window: timedelta):
+        self.live_interval = live_interval
+        self.idle_interval = idle_interval
+        self.kickoff_window = kickoff_window
+        self.instance = str(uuid.uuid4())
+        # Outlives one live interval so the holder keeps it between polls
+        self.lease_seconds = max(2 * live_interval, 30.0)
+        self.metrics = {
+            "running": False,
+            "runs": 0,
+            "failures": 0,
+            "skipped_overlaps": 0,
+            "skipped_not_leader": 0,
+            "last_run_at": None,
+            "last_duration_ms": None,
+            "last_changes": None,
+            "interval_seconds": None
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self.metrics["running"] = True
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self.metrics["running"] = False
+            try:
+                await release_lease("live_poller", self.instance)
+            except Exception as e:
+                logger.error(f"Releasing the live poller lease failed: {e}")
+
+    async def _run(self):
+        while True:
+            await self.poll_once()
+            try:
+                interval = await self.next_interval()
+            except Exception as e:
+                logger.error(f"Live poller scheduling failed: {e}")
+                interval = self.live_interval
+            self.metrics["interval_seconds"] = interval
+            await asyncio.sleep(interval)
+
+    async def poll_once(self):
+        if match_sync_lock.locked():
+            self.metrics["skipped_overlaps"] += 1
+            return
+        # Other workers' pollers would spend the same upstream quota
+        try:
+            leader = await acquire_lease("live_poller", self.instance, self.lease_seconds)
+        except Exception as e:
+            self.metrics["failures"] += 1
+            logger.error(f"Live poller lease failed: {e}")
+            return
+        if not leader:
+            self.metrics["skipped_not_leader"] += 1
+            return
+        async with match_sync_lock:
+            started = time.monotonic()
+            try:
+                self.metrics["last_changes"] = await sync_competition_matches()
+            except Exception as e:
+                self.metrics["failures"] += 1
+                logger.error(f"Live poller sync failed: {e}")
+            self.metrics["runs"] += 1
+            self.metrics["last_run_at"] = datetime.now(timezone.utc).isoformat()
+            self.metrics["last_duration_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+    async def next_interval(self) -> float:
+        live = await db.matches.find_one({"status": {"$in": LIVE_STATUSES}}, {"_id": 1})
+        if live:
+            return self.live_interval
+        
+        now = datetime.now(timezone.utc)
+        # Matches still marked upcoming shortly after kickoff count as live
+        upcoming = await db.matches.find(
+            {"status": {"$in": UPCOMING_STATUSES},
+             "utc_date": {"$gte": (now - timedelta(hours=3)).strftime("%Y-%m-%dT%H:%M:%S")}},
+            {"_id": 0, "utc_date": 1}
+        ).sort("utc_date", 1).limit(1).to_list(1)
+        if not upcoming:
+            return self.idle_interval
+        
+        kickoff = datetime.fromisoformat(upcoming[0]["utc_date"].replace('Z', '+00:00'))
+        until_window = (kickoff - self.kickoff_window - now).total_seconds()
+        if until_window <= 0:
+            return self.live_interval
+        return max(self.live_interval, min(self.idle_interval, until_window))
+
+live_poller = LiveScorePoller(
+    LIVE_POLL_INTERVAL,
+    IDLE_POLL_INTERVAL,
+    timedelta(minutes=KICKOFF_WINDOW_MINUTES)
+)
 
 @api_router.get("/standings")
-async def get_standings(competition_id: int = 2000):
-    standings = await db.standings.find({"competition_id": competition_id}, {"_id": 0}).to_list(100)
+async def get_standings(request: Request, competition_id: int = 2000):
+    return await cached_json_response(request, lambda: load_standings(competition_id))
+
+async def load_standings(competition_id: int):
+    standings = await db.standings.find(
+        {"competition_id": competition_id},
+        {"_id": 0, "results": 0, "teams": 0}
+    ).sort("group", 1).to_list(100)
     if not standings:
         # Generate from matches
         standings = await calculate_standings()
     return standings
 
 async def calculate_standings():
-    """Calculate group standings from matches"""
-    matches = await db.matches.find({"stage": "GROUP_STAGE", "status": "FINISHED"}, {"_id": 0}).to_list(200)
-    
-    standings_data = {}
+    """Rebuild and persist every group table from the finished matches"""
+    matches = await db.matches.find(
+        {"stage": "GROUP_STAGE", "status": "FINISHED"},
+        {"_id": 0, "id": 1, "competition_id": 1, "group": 1, "status": 1,
+         "stage": 1, "home_team": 1, "away_team": 1, "score": 1}
+    ).to_list(None)
+    
+    standings_docs: Dict[str, dict] = {}
     for match in matches:
-        group = match.get("group", "").replace("GROUP_", "")
-        if not group:
+        group = _standings_group(match)
+        result = _standings_result(match)
+        if not group or not result:
             continue
-        
-        if group not in standings_data:
-            standings_data[group] = {}
-        
-        home = match["home_team"]["name"]
-        away = match["away_team"]["name"]
-        home_score = match["score"].get("home", 0) or 0
-        away_score = match["score"].get("away", 0) or 0
-        
-        for team, gf, ga, is_home in [(home, home_score, away_score, True), (away, away_score, home_score, False)]:
-            if team not in standings_data[group]:
-                standings_data[group][team] = {
-                    "team": team,
-                    "played": 0, "won": 0, "drawn": 0, "lost": 0,
-                    "goals_for": 0, "goals_against": 0, "goal_diff": 0, "points": 0
-                }
-            
-            standings_data[group][team]["played"] += 1
-            standings_data[group][team]["goals_for"] += gf
-            standings_data[group][team]["goals_against"] += ga
-            standings_data[group][team]["goal_diff"] = standings_data[group][team]["goals_for"] - standings_data[group][team]["goals_against"]
-            
-            if gf > ga:
-                standings_data[group][team]["won"] += 1
-                standings_data[group][team]["points"] += 3
-            elif gf == ga:
-                standings_data[group][team]["drawn"] += 1
-                standings_data[group][team]["points"] += 1
-            else:
-                standings_data[group][team]["lost"] += 1
+        doc = standings_docs.setdefault(group, _empty_standings(match, group))
+        doc["results"][str(match["id"])] = result
+        _apply_result(doc["teams"], result, 1)
     
     result = []
-    for group, teams in standings_data.items():
-        sorted_teams = sorted(
-            teams.values(),
-            key=lambda x: (-x["points"], -x["goal_diff"], -x["goals_for"])
+    for group, doc in sorted(standings_docs.items()):
+        doc["table"] = _rank_teams(doc["teams"], doc["results"])
+        await db.standings.replace_one(
+            {"competition_id": doc["competition_id"], "group": group}, doc, upsert=True
         )
         result.append({
             "group": group,
-            "competition_id": 2000,
-            "table": sorted_teams
+            "competition_id": doc["competition_id"],
+            "table": doc["table"]
         })
-    
+    for competition_id in {doc["competition_id"] for doc in standings_docs.values()}:
+        await publish_standings_update(competition_id)
     return result
 
+async def publish_standings_update(competition_id: int):
+    # Tables are written after the match change event has already cleared
+    # cached responses, so every worker has to drop them again
+    await ws_bus.publish(f"standings:{competition_id}", {"type": "standings_updated"})
+
+_standings_locks: Dict[str, asyncio.Lock] = {}
+
+async def apply_standings_result(match: dict):
+    """Apply, correct or revert one group-stage result in its persisted table.
+
+    Each group document keeps the results it has applied, so a corrected
+    score first reverts the old result and a match that is no longer
+    finished is removed. Only the affected group is read and rewritten.
+    """
+    group = _standings_group(match)
+    if not group:
+        return
+    key = f"{match['competition_id']}:{group}"
+    async with _standings_locks.setdefault(key, asyncio.Lock()):
+        doc = await db.standings.find_one(
+            {"competition_id": match["competition_id"], "group": group}, {"_id": 0}
+        )
+        if doc is None:
+            # No table yet: build it from every finished match at once
+            await calculate_standings()
+            return
+        
+        match_key = str(match["id"])
+        previous = doc["results"].get(match_key)
+        result = _standings_result(match)
+        if previous == result:
+            return
+        if previous:
+            _apply_result(doc["teams"], previous, -1)
+            del doc["results"][match_key]
+        if result:
+            doc["results"][match_key] = result
+            _apply_result(doc["teams"], result, 1)
+        
+        doc["table"] = _rank_teams(doc["teams"], doc["results"])
+        await db.standings.replace_one(
+            {"competition_id": doc["competition_id"], "group": group}, doc, upsert=True
+        )
+    await publish_standings_update(match["competition_id"])
+
+def _standings_group(match: dict) -> Optional[str]:
+    if match.get("stage") != "GROUP_STAGE":
+        return None
+    return (match.get("group") or "").replace("GROUP_", "") or None
+
+def _standings_result(match: dict) -> Optional[dict]:
+    score = match.get("score") or {}
+    if match.get("status") != "FINISHED" or score.get("home") is None or score.get("away") is None:
+        return None
+    return {
+        "home": match["home_team"]["name"],
+        "away": match["away_team"]["name"],
+        "home_score": score["home"],
+        "away_score": score["away"]
+    }
+
+def _empty_standings(match: dict, group: str) -> dict:
+    return {
+        "group": group,
+        "competition_id": match.get("competition_id", 2000),
+        "teams": {},
+        "results": {},
+        "table": []
+    }
+
+def _apply_result(teams: Dict[str, dict], result: dict, sign: int):
+    """Add (sign=1) or remove (sign=-1) one result from the team rows"""
+    for team, gf, ga in [
+        (result["home"], result["home_score"], result["away_score"]),
+        (result["away"], result["away_score"], result["home_score"])
+    ]:
+        row = teams.setdefault(team, {
+            "team": team,
+            "played": 0, "won": 0, "drawn": 0, "lost": 0,
+            "goals_for": 0, "goals_against": 0, "goal_diff": 0, "points": 0
+        })
+        row["played"] += sign
+        row["goals_for"] += sign * gf
+        row["goals_against"] += sign * ga
+        row["goal_diff"] = row["goals_for"] - row["goals_against"]
+        if gf > ga:
+            row["won"] += sign
+            row["points"] += sign * 3
+        elif gf == ga:
+            row["drawn"] += sign
+            row["points"] += sign
+        else:
+            row["lost"] += sign
+        if row["played"] == 0:
+            del teams[team]
+
+def _rank_teams(teams: Dict[str, dict], results: Dict[str, dict]) -> List[dict]:
+    """Order by points, goal difference and goals scored, then head-to-head.
+
+    Teams still level are compared on points, goal difference and goals in
+    the matches between themselves, and finally by name.
+    """
+    def overall_key(row):
+        return (-row["points"], -row["goal_diff"], -row["goals_for"])
+    
+    ordered = sorted(teams.values(), key=overall_key)
+    table = []
+    idx = 0
+    while idx < len(ordered):
+        tied = [ordered[idx]]
+        while idx + len(tied) < len(ordered) and \
+                overall_key(ordered[idx + len(tied)]) == overall_key(tied[0]):
+            tied.append(ordered[idx + len(tied)])
+        if len(tied) > 1:
+            names = {row["team"] for row in tied}
+            head_to_head: Dict[str, dict] = {}
+            for result in results.values():
+                if result["home"] in names and result["away"] in names:
+                    _apply_result(head_to_head, result, 1)
+            empty = {"points": 0, "goal_diff": 0, "goals_for": 0}
+            tied.sort(key=lambda row: (
+                overall_key(head_to_head.get(row["team"], empty)), row["team"]
+            ))
+        table.extend(dict(row) for row in tied)
+        idx += len(tied)
+    return table
+
+# ==================== MATCH SCHEDULE ====================
+
+PREDICTION_LOCK = timedelta(minutes=15)
+MATCH_SCHEDULE_PROJECTION = {"_id": 0, "id": 1, "utc_date": 1, "status": 1, "competition_id": 1}
+
+class MatchSchedule:
+    """Process-local kickoff, lock time and status of every match.
+
+    Loaded on startup and kept current from the match change events, so
+    prediction lock checks need neither a DB read nor date parsing.
+    Unknown and expired ids fall back to the database.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.metrics = {"hits": 0, "misses": 0, "size": 0}
+        self._entries: Dict[int, dict] = {}
+
+    def update(self, match: dict):
+        kickoff = datetime.fromisoformat(match["utc_date"].replace('Z', '+00:00'))
+        self._entries[match["id"]] = {
+            "kickoff": kickoff,
+            "lock_time": kickoff - PREDICTION_LOCK,
+            "status": match.get("status"),
+            "competition_id": match.get("competition_id"),
+            "expires_at": time.monotonic() + self.ttl
+        }
+        self.metrics["size"] = len(self._entries)
+
+    def _fresh(self, match_id: int) -> Optional[dict]:
+        entry = self._entries.get(match_id)
+        if entry is None or entry["expires_at"] <= time.monotonic():
+            return None
+        return entry
+
+    async def load(self):
+        self._entries = {}
+        async for match in db.matches.find({}, MATCH_SCHEDULE_PROJECTION):
+            self.update(match)
+        self.metrics["size"] = len(self._entries)
+        logger.info(f"Match schedule loaded with {len(self._entries)} matches")
+
+    async def get(self, match_id: int) -> Optional[dict]:
+        entry = self._fresh(match_id)
+        if entry is not None:
+            self.metrics["hits"] += 1
+            return entry
+        self.metrics["misses"] += 1
+        match = await db.matches.find_one({"id": match_id}, MATCH_SCHEDULE_PROJECTION)
+        if not match:
+            return None
+        self.update(match)
+        return self._entries[match_id]
+
+    async def get_many(self, match_ids: Iterable[int]) -> Dict[int, dict]:
+        """Entries for ``match_ids``, reading all unknown or expired ids in one query"""
+        found = {}
+        missing = []
+        for match_id in set(match_ids):
+            entry = self._fresh(match_id)
+            if entry is None:
+                missing.append(match_id)
+            else:
+                found[match_id] = entry
+        self.metrics["hits"] += len(found)
+        if missing:
+            self.metrics["misses"] += len(missing)
+            async for match in db.matches.find({"id": {"$in": missing}}, MATCH_SCHEDULE_PROJECTION):
+                self.update(match)
+                found[match["id"]] = self._entries[match["id"]]
+        return found
+
+match_schedule = MatchSchedule(MATCH_SCHEDULE_TTL)
+
+# ==================== PREDICTION WRITES ====================
+
+def prediction_doc(user_id: str, prediction: PredictionCreate, now: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "match_id": prediction.match_id,
+        "home_score": prediction.home_score,
+        "away_score": prediction.away_score,
+        "is_joker": prediction.is_joker,
+        "points_earned": 0,
+        "created_at": now,
+        "updated_at": now
+    }
+
+def prediction_stats_fields(prediction: dict) -> Dict[str, int]:
+    """Counters one prediction contributes to its match's ``prediction_stats``"""
+    home, away = prediction["home_score"], prediction["away_score"]
+    outcome = "home_wins" if home > away else "away_wins" if away > home else "draws"
+    return {
+        "count": 1,
+        outcome: 1,
+        "home_goals": home,
+        "away_goals": away,
+        "jokers": 1 if prediction.get("is_joker") else 0,
+        f"scorelines.{home}-{away}": 1
+    }
+
+def prediction_stats_deltas(docs: List[dict], previous: Dict[Tuple[str, int], dict]) -> Dict[int, Dict[str, int]]:
+    """Per-match ``$inc`` deltas for replacing ``previous`` with ``docs``"""
+    deltas: Dict[int, Dict[str, int]] = {}
+    for doc in docs:
+        inc = deltas.setdefault(doc["match_id"], {})
+        old = previous.get((doc["user_id"], doc["match_id"]))
+        for sign, prediction in ((1, doc), (-1, old)):
+            if prediction is None:
+                continue
+            for field, value in prediction_stats_fields(prediction).items():
+                inc[field] = inc.get(field, 0) + sign * value
+    return {
+        match_id: {field: value for field, value in inc.items() if value}
+        for match_id, inc in deltas.items()
+    }
+
+async def stored_predictions(docs: List[dict]) -> Dict[Tuple[str, int], Optional[dict]]:
+    """Stored version of each doc's prediction, None where there is none yet"""
+    stored = {(doc["user_id"], doc["match_id"]): None for doc in docs}
+    async for old in db.predictions.find(
+        {"$or": [{"user_id": doc["user_id"], "match_id": doc["match_id"]} for doc in docs]},
+        {"_id": 0, "user_id": 1, "match_id": 1, "home_score": 1, "away_score": 1, "is_joker": 1}
+    ):
+        stored[(old["user_id"], old["match_id"])] = old
+    return stored
+
+async def upsert_predictions(docs: List[dict]):
+    """Upsert predictions (one per user per match) with a single bulk write"""
+    await db.predictions.bulk_write([
+        UpdateOne(
+            {"user_id": doc["user_id"], "match_id": doc["match_id"]},
+            {"$set": doc},
+            upsert=True
+        )
+        for doc in docs
+    ], ordered=False)
+
+def prediction_counter_updates(
+    docs: List[dict], previous: Dict[Tuple[str, int], Optional[dict]]
+) -> List[Tuple[str, List[UpdateOne]]]:
+    """``(collection, ops)`` updating the counters for replacing ``previous`` with ``docs``"""
+    inserted: Dict[str, int] = {}
+    for doc in docs:
+        if previous.get((doc["user_id"], doc["match_id"])) is None:
+            inserted[doc["user_id"]] = inserted.get(doc["user_id"], 0) + 1
+    updates = []
+    if inserted:
+        updates.append(("users", [
+            UpdateOne({"id": user_id}, {"$inc": {"predictions_count": count}})
+            for user_id, count in inserted.items()
+        ]))
+    stats_ops = [
+        UpdateOne({"match_id": match_id}, {"$inc": inc}, upsert=True)
+        for match_id, inc in prediction_stats_deltas(docs, previous).items() if inc
+    ]
+    if stats_ops:
+        updates.append(("prediction_stats", stats_ops))
+    return updates
+
+async def rebuild_prediction_stats() -> int:
+    """Recompute every match's ``prediction_stats`` from the predictions"""
+    await prediction_write_buffer.flush()
+    prediction_write_buffer.discard_counters("prediction_stats")
+    pipeline = [
+        {"$group": {
+            "_id": {"match_id": "$match_id", "home": "$home_score", "away": "$away_score"},
+            "count": {"$sum": 1},
+            "jokers": {"$sum": {"$cond": ["$is_joker", 1, 0]}}
+        }}
+    ]
+    stats: Dict[int, dict] = {}
+    async for entry in db.predictions.aggregate(pipeline):
+        key, count = entry["_id"], entry["count"]
+        doc = stats.setdefault(key["match_id"], {"match_id": key["match_id"], "scorelines": {}})
+        fields = prediction_stats_fields({"home_score": key["home"], "away_score": key["away"]})
+        fields.pop(f"scorelines.{key['home']}-{key['away']}")
+        for field, value in fields.items():
+            doc[field] = doc.get(field, 0) + value * count
+        doc["jokers"] = doc.get("jokers", 0) + entry["jokers"]
+        doc["scorelines"][f"{key['home']}-{key['away']}"] = count
+    await db.prediction_stats.delete_many({"match_id": {"$nin": list(stats)}})
+    if stats:
+        await db.prediction_stats.bulk_write([
+            ReplaceOne({"match_id": match_id}, doc, upsert=True)
+            for match_id, doc in stats.items()
+        ], ordered=False)
+    return len(stats)
+
+class PredictionWriteBuffer:
+    """Write-behind buffer coalescing prediction edits per ``(user_id, match_id)``.
+
+    Flushed after ``window`` seconds, at a buffered match's lock time, or before reads.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self.metrics = {"submitted": 0, "coalesced": 0, "flushes": 0, "written": 0, "errors": 0}
+        self._pending: Dict[Tuple[str, int], dict] = {}
+        self._inflight: Dict[Tuple[str, int], dict] = {}
+        # Stored predictions read before a write that has not succeeded yet
+        self._stored: Dict[Tuple[str, int], Optional[dict]] = {}
+        # Counter updates for written predictions, applied in order
+        self._counters: deque = deque()
+        self._deadline = float("inf")
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and self._task is not None
+
+    def start(self):
+        if self.window > 0 and self._task is None:
+            # Bind the primitives to the loop the app is running on
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def submit(self, docs: List[dict], lock_times: Dict[int, datetime]):
+        """Queue ``docs``; written immediately when buffering is off"""
+        self.metrics["submitted"] += len(docs)
+        if not self.enabled:
+            try:
+                await self._write(docs)
+            except Exception:
+                # The client retries, possibly on another worker; read afresh then
+                for doc in docs:
+                    self._stored.pop((doc["user_id"], doc["match_id"]), None)
+                raise
+            self.metrics["written"] += len(docs)
+            await self._apply_counters()
+            return
+        now = time.monotonic()
+        utc_now = datetime.now(timezone.utc)
+        deadline = self._deadline
+        for doc in docs:
+            key = (doc["user_id"], doc["match_id"])
+            if key in self._pending:
+                self.metrics["coalesced"] += 1
+            self._pending[key] = doc
+            lock_in = (lock_times[doc["match_id"]] - utc_now).total_seconds()
+            deadline = min(deadline, now + min(self.window, lock_in))
+        if deadline < self._deadline:
+            self._deadline = deadline
+            self._wake.set()
+
+    async def flush(self, user_id: Optional[str] = None, match_id: Optional[int] = None):
+        """Write pending edits, optionally only those of one user or match"""
+        async with self._flush_lock:
+            keys = [
+                key for key in self._pending
+                if (user_id is None or key[0] == user_id)
+                and (match_id is None or key[1] == match_id)
+            ]
+            if not keys:
+                if not self._pending:
+                    self._deadline = float("inf")
+                await self._apply_counters()
+                return
+            docs = [self._pending.pop(key) for key in keys]
+            self._inflight.update(zip(keys, docs))
+            if not self._pending:
+                self._deadline = float("inf")
+            try:
+                await self._write(docs)
+            except Exception:
+                self.metrics["errors"] += 1
+                # Keep the edits for the next flush unless they were superseded
+                for key, doc in zip(keys, docs):
+                    self._pending.setdefault(key, doc)
+                self._retry_soon()
+                raise
+            finally:
+                for key, doc in zip(keys, docs):
+                    if self._inflight.get(key) is doc:
+                        del self._inflight[key]
+            self.metrics["flushes"] += 1
+            self.metrics["written"] += len(docs)
+            await self._apply_counters()
+
+    async def _write(self, docs: List[dict]):
+        """Upsert ``docs`` and queue their counter updates"""
+        if not docs:
+            return
+        keys = [(doc["user_id"], doc["match_id"]) for doc in docs]
+        # A retried write diffs against what was stored before its first attempt
+        unread = [doc for key, doc in zip(keys, docs) if key not in self._stored]
+        if unread:
+            self._stored.update(await stored_predictions(unread))
+        previous = {key: self._stored[key] for key in keys}
+        await upsert_predictions(docs)
+        for key in keys:
+            self._stored.pop(key, None)
+        self._counters.extend(prediction_counter_updates(docs, previous))
+
+    async def _apply_counters(self):
+        """Apply queued counter updates; a failed one stays queued for the next flush"""
+        while self._counters:
+            collection, ops = self._counters.popleft()
+            try:
+                await db[collection].bulk_write(ops, ordered=False)
+            except Exception as e:
+                self._counters.appendleft((collection, ops))
+                self.metrics["errors"] += 1
+                self._retry_soon()
+                logger.error(f"Prediction counter update failed: {e}")
+                return
+
+    def discard_counters(self, collection: str):
+        """Drop queued updates to ``collection`` once it has been rebuilt"""
+        self._counters = deque(update for update in self._counters if update[0] != collection)
+
+    def _retry_soon(self):
+        self._deadline = min(self._deadline, time.monotonic() + max(self.window, 1.0))
+
+    def get(self, user_id: str, match_id: int) -> Optional[dict]:
+        key = (user_id, match_id)
+        return self._pending.get(key) or self._inflight.get(key)
+
+    async def _run(self):
+        while True:
+            delay = self._deadline - time.monotonic()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=min(delay, 3600))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Prediction flush failed: {e}")
+
+prediction_write_buffer = PredictionWriteBuffer(PREDICTION_WRITE_WINDOW)
+
 # ==================== PREDICTIONS ====================
 
 @api_router.post("/predictions", response_model=PredictionResponse)
@@ -504,78 +1724,104 @@ async def create_prediction(
     current_user: dict = Depends(get_current_user)
 ):
     # Check if match exists and is open for predictions
-    match = await db.matches.find_one({"id": prediction.match_id}, {"_id": 0})
-    if not match:
+    schedule = await match_schedule.get(prediction.match_id)
+    if not schedule:
         raise HTTPException(status_code=404, detail="Match not found")
     
     # Check lock time (15 minutes before kickoff)
-    match_date = datetime.fromisoformat(match["utc_date"].replace('Z', '+00:00'))
-    lock_time = match_date - timedelta(minutes=15)
-    
-    if datetime.now(timezone.utc) >= lock_time:
+    if datetime.now(timezone.utc) >= schedule["lock_time"]:
         raise HTTPException(status_code=400, detail="Predictions are locked for this match")
     
-    prediction_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
-    
-    prediction_doc = {
-        "id": prediction_id,
-        "user_id": current_user["id"],
-        "match_id": prediction.match_id,
-        "home_score": prediction.home_score,
-        "away_score": prediction.away_score,
-        "is_joker": prediction.is_joker,
-        "points_earned": 0,
-        "created_at": now,
-        "updated_at": now
-    }
-    
-    # Upsert prediction (one per user per match)
-    await db.predictions.update_one(
-        {"user_id": current_user["id"], "match_id": prediction.match_id},
-        {"$set": prediction_doc},
-        upsert=True
-    )
+    doc = prediction_doc(current_user["id"], prediction, datetime.now(timezone.utc).isoformat())
+    await prediction_write_buffer.submit([doc], {prediction.match_id: schedule["lock_time"]})
+    return PredictionResponse(**doc)
+
+@api_router.post("/predictions/batch")
+async def create_predictions_batch(
+    batch: PredictionBatchCreate,
+    current_user: dict = Depends(get_current_user)
+):
+    """Submit many predictions at once.
+
+    Lock times are checked against the match schedule and every open match
+    is upserted in a single bulk write (through the write buffer). Returns one result per submitted
+    prediction, in order, with ``status`` saved, locked, not_found or
+    duplicate (a later entry for the same match wins).
+    """
+    if len(batch.predictions) > PREDICTION_BATCH_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {PREDICTION_BATCH_LIMIT} predictions per batch"
+        )
     
-    return PredictionResponse(
-        id=prediction_id,
-        user_id=current_user["id"],
-        match_id=prediction.match_id,
-        home_score=prediction.home_score,
-        away_score=prediction.away_score,
-        is_joker=prediction.is_joker,
-        points_earned=0,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc)
+    schedules = await match_schedule.get_many(p.match_id for p in batch.predictions)
+    now = datetime.now(timezone.utc)
+    last_index = {p.match_id: idx for idx, p in enumerate(batch.predictions)}
+    
+    results = []
+    docs = []
+    for idx, prediction in enumerate(batch.predictions):
+        schedule = schedules.get(prediction.match_id)
+        if schedule is None:
+            status = "not_found"
+        elif now >= schedule["lock_time"]:
+            status = "locked"
+        elif last_index[prediction.match_id] != idx:
+            status = "duplicate"
+        else:
+            status = "saved"
+            docs.append(prediction_doc(current_user["id"], prediction, now.isoformat()))
+        results.append({"match_id": prediction.match_id, "status": status})
+    
+    await prediction_write_buffer.submit(
+        docs, {doc["match_id"]: schedules[doc["match_id"]]["lock_time"] for doc in docs}
     )
+    saved = {doc["match_id"]: PredictionResponse(**doc) for doc in docs}
+    for result in results:
+        if result["status"] == "saved":
+            result["prediction"] = saved[result["match_id"]]
+    return {"saved": len(saved), "results": results}
 
 @api_router.get("/predictions")
 async def get_predictions(
+    request: Request,
+    response: Response,
     match_id: Optional[int] = None,
+    limit: int = 500,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     query = {"user_id": current_user["id"]}
     if match_id:
         query["match_id"] = match_id
     
-    predictions = await db.predictions.find(query, {"_id": 0}).to_list(500)
+    sort = [("match_id", 1)]
+    await prediction_write_buffer.flush(user_id=current_user["id"])
+    if wants_ndjson(request):
+        return ndjson_response(db.predictions, query, sort, cursor)
+    predictions, headers = await fetch_page(db.predictions, query, sort, limit, cursor)
+    response.headers.update(headers)
     return predictions
 
 @api_router.get("/predictions/match/{match_id}")
 async def get_match_predictions(
+    request: Request,
+    response: Response,
     match_id: int,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     """Get all predictions for a match (only revealed after lock)"""
-    match = await db.matches.find_one({"id": match_id}, {"_id": 0})
-    if not match:
+    schedule = await match_schedule.get(match_id)
+    if not schedule:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    match_date = datetime.fromisoformat(match["utc_date"].replace('Z', '+00:00'))
-    lock_time = match_date - timedelta(minutes=15)
-    
-    if datetime.now(timezone.utc) < lock_time:
+    if datetime.now(timezone.utc) < schedule["lock_time"]:
         # Only return current user's prediction before lock
+        prediction = prediction_write_buffer.get(current_user["id"], match_id)
+        if prediction:
+            return [prediction]
         prediction = await db.predictions.find_one(
             {"match_id": match_id, "user_id": current_user["id"]},
             {"_id": 0}
@@ -583,56 +1829,150 @@ async def get_match_predictions(
         return [prediction] if prediction else []
     
     # After lock, return all predictions
-    predictions = await db.predictions.find({"match_id": match_id}, {"_id": 0}).to_list(1000)
+    await prediction_write_buffer.flush(match_id=match_id)
+    query = {"match_id": match_id}
+    sort = [("user_id", 1)]
+    if wants_ndjson(request):
+        return ndjson_response(db.predictions, query, sort, cursor, enrich=enrich_with_users)
+    predictions, headers = await fetch_page(db.predictions, query, sort, limit, cursor)
+    response.headers.update(headers)
     
     # Add usernames
-    for pred in predictions:
-        user = await db.users.find_one({"id": pred["user_id"]}, {"_id": 0, "username": 1})
-        pred["username"] = user.get("username", "Unknown") if user else "Unknown"
+    return await enrich_with_users(predictions)
+
+@api_router.get("/predictions/match/{match_id}/stats")
+async def get_match_prediction_stats(
+    match_id: int,
+    current_user: dict = Depends(get_current_user)
+):
+    """Crowd prediction distribution for a match, read from one document.
+
+    Like the predictions themselves it is only revealed after lock.
+    """
+    schedule = await match_schedule.get(match_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Match not found")
+    if datetime.now(timezone.utc) < schedule["lock_time"]:
+        raise HTTPException(status_code=403, detail="Prediction stats are revealed after lock")
+    stats = await db.prediction_stats.find_one({"match_id": match_id}, {"_id": 0}) or {}
+    count = stats.get("count", 0)
     
-    return predictions
+    def share(value: int) -> float:
+        return round(value / count, 4) if count else 0.0
+    
+    scorelines = sorted(
+        ((score, n) for score, n in stats.get("scorelines", {}).items() if n > 0),
+        key=lambda item: (-item[1], item[0])
+    )
+    return {
+        "match_id": match_id,
+        "count": count,
+        "outcomes": {
+            "home_win": share(stats.get("home_wins", 0)),
+            "draw": share(stats.get("draws", 0)),
+            "away_win": share(stats.get("away_wins", 0))
+        },
+        "average_goals": {
+            "home": share(stats.get("home_goals", 0)),
+            "away": share(stats.get("away_goals", 0))
+        },
+        "jokers": stats.get("jokers", 0),
+        "scorelines": [
+            {"score": score, "count": n, "share": share(n)}
+            for score, n in scorelines
+        ]
+    }
+
+@api_router.post("/predictions/stats/rebuild")
+async def rebuild_match_prediction_stats(current_user: dict = Depends(get_current_user)):
+    """Admin endpoint to recompute the crowd statistics from predictions"""
+    rebuilt = await rebuild_prediction_stats()
+    return {"message": f"Prediction stats rebuilt for {rebuilt} matches"}
 
 # ==================== LEADERBOARDS ====================
 
+LEADERBOARD_FIELDS = ["total_points", "exact_scores", "goal_diffs", "tendencies"]
+BASE_POINTS_FIELDS = {4: "exact_scores", 3: "goal_diffs", 2: "tendencies"}
+
 @api_router.get("/leaderboards")
 async def get_leaderboard(
     group_id: Optional[str] = None,
     limit: int = 50
 ):
-    pipeline = [
-        {"$group": {
-            "_id": "$user_id",
-            "total_points": {"$sum": "$points_earned"},
-            "predictions_count": {"$sum": 1},
-            "exact_scores": {"$sum": {"$cond": [{"$eq": ["$points_earned", 4]}, 1, 0]}},
-            "goal_diffs": {"$sum": {"$cond": [{"$eq": ["$points_earned", 3]}, 1, 0]}},
-            "tendencies": {"$sum": {"$cond": [{"$eq": ["$points_earned", 2]}, 1, 0]}}
-        }},
-        {"$sort": {"total_points": -1}},
-        {"$limit": limit}
-    ]
-    
-    leaderboard = await db.predictions.aggregate(pipeline).to_list(limit)
+    return await load_leaderboard(limit)
+
+async def load_leaderboard(limit: int) -> List[dict]:
+    # Totals are maintained on the user documents by the scoring engine
+    leaderboard = await db.users.find(
+        {"predictions_count": {"$gt": 0}},
+        {"_id": 0, "id": 1, "username": 1, "avatar": 1, "predictions_count": 1,
+         **{field: 1 for field in LEADERBOARD_FIELDS}}
+    ).sort([("total_points", -1), ("id", 1)]).limit(limit).to_list(limit)
     
-    # Enrich with user data
     result = []
+    rank = 0
     for idx, entry in enumerate(leaderboard):
-        user = await db.users.find_one({"id": entry["_id"]}, {"_id": 0, "username": 1, "avatar": 1})
+        # Tied users share a rank, matching get_global_rank
+        if idx == 0 or entry.get("total_points", 0) != result[-1]["total_points"]:
+            rank = idx + 1
         result.append({
-            "rank": idx + 1,
-            "user_id": entry["_id"],
-            "username": user.get("username", "Unknown") if user else "Unknown",
-            "avatar": user.get("avatar") if user else None,
-            "total_points": entry["total_points"],
-            "predictions_count": entry["predictions_count"],
-            "exact_scores": entry["exact_scores"],
-            "goal_diffs": entry["goal_diffs"],
-            "tendencies": entry["tendencies"],
+            "rank": rank,
+            "user_id": entry["id"],
+            "username": entry.get("username", "Unknown"),
+            "avatar": entry.get("avatar"),
+            "total_points": entry.get("total_points", 0),
+            "predictions_count": entry.get("predictions_count", 0),
+            "exact_scores": entry.get("exact_scores", 0),
+            "goal_diffs": entry.get("goal_diffs", 0),
+            "tendencies": entry.get("tendencies", 0),
             "movement": 0  # Would compare with previous snapshot
         })
     
     return result
 
+@api_router.post("/leaderboards/rebuild")
+async def rebuild_leaderboard(current_user: dict = Depends(get_current_user)):
+    """Admin endpoint to recompute the materialized leaderboard from predictions"""
+    rebuilt = await rebuild_leaderboard_totals()
+    return {"message": f"Leaderboard rebuilt for {rebuilt} users"}
+
+async def rebuild_leaderboard_totals() -> int:
+    """Recompute every user's leaderboard totals with one aggregation"""
+    await prediction_write_buffer.flush()
+    prediction_write_buffer.discard_counters("users")
+    base_points = {"$cond": [
+        "$is_joker",
+        {"$divide": ["$points_earned", 2]},
+        "$points_earned"
+    ]}
+    pipeline = [
+        {"$group": {
+            "_id": "$user_id",
+            "total_points": {"$sum": "$points_earned"},
+            "predictions_count": {"$sum": 1},
+            **{
+                field: {"$sum": {"$cond": [{"$eq": [base_points, base]}, 1, 0]}}
+                for base, field in BASE_POINTS_FIELDS.items()
+            }
+        }}
+    ]
+    await db.users.update_many({}, {"$set": {
+        "predictions_count": 0, **{field: 0 for field in LEADERBOARD_FIELDS}
+    }})
+    ops = []
+    rebuilt = 0
+    async for entry in db.predictions.aggregate(pipeline):
+        totals = {key: value for key, value in entry.items() if key != "_id"}
+        ops.append(UpdateOne({"id": entry["_id"]}, {"$set": totals}))
+        if len(ops) >= SCORING_BATCH_SIZE:
+            await db.users.bulk_write(ops, ordered=False)
+            rebuilt += len(ops)
+            ops = []
+    if ops:
+        await db.users.bulk_write(ops, ordered=False)
+        rebuilt += len(ops)
+    return rebuilt
+
 @api_router.get("/leaderboards/group/{group_id}")
 async def get_group_leaderboard(
     group_id: str,
@@ -649,28 +1989,25 @@ async def get_group_leaderboard(
     
     member_ids = group.get("members", [])
     
-    pipeline = [
-        {"$match": {"user_id": {"$in": member_ids}}},
-        {"$group": {
-            "_id": "$user_id",
-            "total_points": {"$sum": "$points_earned"},
-            "predictions_count": {"$sum": 1}
-        }},
-        {"$sort": {"total_points": -1}}
-    ]
-    
-    leaderboard = await db.predictions.aggregate(pipeline).to_list(100)
+    # Totals and user details both live on the materialized user documents
+    leaderboard = await db.users.find(
+        {"id": {"$in": member_ids}, "predictions_count": {"$gt": 0}},
+        {"_id": 0, "id": 1, "username": 1, "avatar": 1,
+         "total_points": 1, "predictions_count": 1}
+    ).sort([("total_points", -1), ("id", 1)]).to_list(len(member_ids))
     
     result = []
+    rank = 0
     for idx, entry in enumerate(leaderboard):
-        user = await db.users.find_one({"id": entry["_id"]}, {"_id": 0, "username": 1, "avatar": 1})
+        if idx == 0 or entry.get("total_points", 0) != result[-1]["total_points"]:
+            rank = idx + 1
         result.append({
-            "rank": idx + 1,
-            "user_id": entry["_id"],
-            "username": user.get("username", "Unknown") if user else "Unknown",
-            "avatar": user.get("avatar") if user else None,
-            "total_points": entry["total_points"],
-            "predictions_count": entry["predictions_count"],
+            "rank": rank,
+            "user_id": entry["id"],
+            "username": entry.get("username", "Unknown"),
+            "avatar": entry.get("avatar"),
+            "total_points": entry.get("total_points", 0),
+            "predictions_count": entry.get("predictions_count", 0),
             "movement": 0
         })
     
@@ -763,11 +2100,12 @@ async def get_group(
         raise HTTPException(status_code=403, detail="Not a member")
     
     # Get member details
-    members = []
-    for member_id in group.get("members", []):
-        user = await db.users.find_one({"id": member_id}, {"_id": 0, "id": 1, "username": 1, "avatar": 1})
-        if user:
-            members.append(user)
+    profiles = await get_user_profiles(group.get("members", []))
+    members = [
+        profiles[member_id]
+        for member_id in group.get("members", [])
+        if member_id in profiles
+    ]
     
     group["members_details"] = members
     group["member_count"] = len(members)
@@ -776,49 +2114,41 @@ async def get_group(
 
 # ==================== USER PROFILE ====================
 
+async def get_global_rank(total_points: int) -> int:
+    """Competition-style rank: one more than the number of users ahead.
+
+    Served by the leaderboard index, so ties share a rank and the cost does
+    not depend on the number of players. Users without predictions have no
+    points, so leaving them out does not change the count.
+    """
+    ahead = await db.users.count_documents(
+        {"predictions_count": {"$gt": 0}, "total_points": {"$gt": total_points}}
+    )
+    return ahead + 1
+
 @api_router.get("/users/profile")
 async def get_profile(current_user: dict = Depends(get_current_user)):
-    # Get user stats
-    pipeline = [
-        {"$match": {"user_id": current_user["id"]}},
-        {"$group": {
-            "_id": None,
-            "total_points": {"$sum": "$points_earned"},
-            "predictions_count": {"$sum": 1},
-            "exact_scores": {"$sum": {"$cond": [{"$eq": ["$points_earned", 4]}, 1, 0]}},
-            "goal_diffs": {"$sum": {"$cond": [{"$eq": ["$points_earned", 3]}, 1, 0]}},
-            "tendencies": {"$sum": {"$cond": [{"$eq": ["$points_earned", 2]}, 1, 0]}}
-        }}
-    ]
-    
-    stats_result = await db.predictions.aggregate(pipeline).to_list(1)
-    stats = stats_result[0] if stats_result else {
-        "total_points": 0,
-        "predictions_count": 0,
-        "exact_scores": 0,
-        "goal_diffs": 0,
-        "tendencies": 0
+    user, stats = await load_user_stats(current_user["id"])
+    return {"user": user, "stats": stats}
+
+async def load_user_stats(user_id: str) -> Tuple[dict, dict]:
+    # User stats are maintained on the user document by the scoring engine
+    await prediction_write_buffer.flush(user_id=user_id)
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password": 0})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    stats = {
+        field: user.get(field, 0)
+        for field in ["predictions_count", *LEADERBOARD_FIELDS]
     }
     
-    # Get global rank
-    all_users_pipeline = [
-        {"$group": {"_id": "$user_id", "total_points": {"$sum": "$points_earned"}}},
-        {"$sort": {"total_points": -1}}
-    ]
-    all_rankings = await db.predictions.aggregate(all_users_pipeline).to_list(10000)
-    
-    global_rank = 1
-    for idx, user in enumerate(all_rankings):
-        if user["_id"] == current_user["id"]:
-            global_rank = idx + 1
-            break
-    
-    # Get groups count
-    groups_count = await db.groups.count_documents({"members": current_user["id"]})
+    # Rank and group count are independent, so fetch them together
+    global_rank, groups_count = await asyncio.gather(
+        get_global_rank(stats["total_points"]),
+        db.groups.count_documents({"members": user_id})
+    )
     
-    return {
-        "user": current_user,
-        "stats": {
+    return user, {
             "total_points": stats.get("total_points", 0),
             "predictions_count": stats.get("predictions_count", 0),
             "exact_scores": stats.get("exact_scores", 0),
@@ -830,49 +2160,381 @@ async def get_profile(current_user: dict = Depends(get_current_user)):
                 (stats.get("exact_scores", 0) + stats.get("goal_diffs", 0) + stats.get("tendencies", 0)) 
                 / max(stats.get("predictions_count", 1), 1) * 100, 1
             )
-        }
     }
 
+# ==================== DASHBOARD ====================
+
+# Matches that kicked off this long ago still count as "upcoming" (live)
+DASHBOARD_RECENT_WINDOW = timedelta(hours=2)
+
+@api_router.get("/dashboard")
+async def get_dashboard(
+    competition_id: int = 2000,
+    matches: int = 3,
+    top: int = 5,
+    current_user: dict = Depends(get_current_user)
+):
+    """Everything the Home page needs in one round trip.
+
+    The caller's stats and rank, the next matches with the caller's own
+    predictions joined in, and the top of the leaderboard are loaded
+    concurrently.
+    """
+    # Write the caller's buffered edits first so every load below sees them
+    await prediction_write_buffer.flush(user_id=current_user["id"])
+    (user, stats), upcoming, leaderboard = await asyncio.gather(
+        load_user_stats(current_user["id"]),
+        load_upcoming_matches(current_user["id"], competition_id, min(max(matches, 0), MAX_PAGE_SIZE)),
+        load_leaderboard(min(max(top, 0), MAX_PAGE_SIZE))
+    )
+    return {
+        "user": user,
+        "stats": stats,
+        "upcoming_matches": upcoming,
+        "leaderboard": leaderboard
+    }
+
+async def load_upcoming_matches(user_id: str, competition_id: int, limit: int) -> List[dict]:
+    if not limit:
+        return []
+    since = (datetime.now(timezone.utc) - DASHBOARD_RECENT_WINDOW).isoformat()
+    upcoming = await db.matches.find(
+        {"competition_id": competition_id, "utc_date": {"$gte": since}},
+        {"_id": 0}
+    ).sort(MATCH_LIST_SORT).limit(limit).to_list(limit)
+    
+    match_ids = [match["id"] for match in upcoming]
+    predictions = {
+        prediction["match_id"]: prediction
+        async for prediction in db.predictions.find(
+            {"user_id": user_id, "match_id": {"$in": match_ids}}, {"_id": 0}
+        )
+    }
+    for match in upcoming:
+        # Edits saved while this request ran are newer than what was read
+        match["user_prediction"] = (
+            prediction_write_buffer.get(user_id, match["id"]) or predictions.get(match["id"])
+        )
+    return upcoming
+
 # ==================== WEBSOCKET ====================
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+    """Fans messages out to WebSocket clients grouped by competition.
+
+    Every connection gets a bounded send queue drained by its own writer
+    task. A broadcast serializes the message once and only enqueues it, so
+    one slow client never delays the others; a client whose queue is full
+    is disconnected instead of being waited on.
+    """
+
+    def __init__(self, queue_size: int = WS_SEND_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = {}
+        self.metrics = {"messages_sent": 0, "slow_consumers_dropped": 0}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket, competition_id: str):
         await websocket.accept()
-        if competition_id not in self.active_connections:
-            self.active_connections[competition_id] = []
-        self.active_connections[competition_id].append(websocket)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.active_connections.setdefault(competition_id, {})[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer(websocket, competition_id, queue)
+        )
     
     def disconnect(self, websocket: WebSocket, competition_id: str):
         if competition_id in self.active_connections:
-            if websocket in self.active_connections[competition_id]:
-                self.active_connections[competition_id].remove(websocket)
+            self.active_connections[competition_id].pop(websocket, None)
+            if not self.active_connections[competition_id]:
+                del self.active_connections[competition_id]
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+    
+    async def send(self, websocket: WebSocket, competition_id: str, message: dict):
+        """Queue a message for one client behind anything already queued"""
+        queue = self.active_connections.get(competition_id, {}).get(websocket)
+        if queue is not None:
+            await queue.put(json.dumps(message, default=str))
     
     async def broadcast(self, competition_id: str, message: dict):
-        if competition_id in self.active_connections:
-            dead_connections = []
-            for connection in self.active_connections[competition_id]:
-                try:
-                    await connection.send_json(message)
-                except:
-                    dead_connections.append(connection)
-            for dc in dead_connections:
-                self.disconnect(dc, competition_id)
+        connections = self.active_connections.get(competition_id)
+        if not connections:
+            return
+        payload = json.dumps(message, default=str)
+        for websocket, queue in list(connections.items()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self.metrics["slow_consumers_dropped"] += 1
+                self.disconnect(websocket, competition_id)
+                asyncio.create_task(self._close(websocket))
+    
+    async def _writer(self, websocket: WebSocket, competition_id: str, queue: asyncio.Queue):
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+                self.metrics["messages_sent"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket, competition_id)
+    
+    async def _close(self, websocket: WebSocket):
+        try:
+            # 1013: try again later
+            await websocket.close(code=1013)
+        except Exception:
+            pass
 
 ws_manager = ConnectionManager()
 
+class InMemoryEventBus:
+    """Publishes WebSocket events to subscribers in this process only.
+
+    Enough for a single worker and for tests; ``MongoEventBus`` extends it
+    to fan events out across workers and nodes.
+    """
+
+    def __init__(self):
+        self._handlers: List[Callable] = []
+
+    def subscribe(self, handler: Callable):
+        self._handlers.append(handler)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def publish(self, channel: str, message: dict):
+        await self._dispatch(channel, message)
+
+    async def _dispatch(self, channel: str, message: dict):
+        for handler in self._handlers:
+            try:
+                await handler(channel, message)
+            except Exception as e:
+                logger.error(f"Event handler failed on {channel}: {e}")
+
+class MongoEventBus(InMemoryEventBus):
+    """Fans WebSocket events out to every worker by tailing a capped collection.
+
+    Tailers resume from the highest contiguous ``seq`` they have delivered.
+    """
+
+    # Gaps left by a publisher that died between reserving a seq and
+    # inserting the event are given up on after this many later events
+    MAX_PENDING_GAP = 1000
+
+    def __init__(self, database, collection_name: str, size_bytes: int):
+        super().__init__()
+        self.database = database
+        self.collection_name = collection_name
+        self.size_bytes = size_bytes
+        self.origin = str(uuid.uuid4())
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def collection(self):
+        return self.database[self.collection_name]
+
+    async def start(self):
+        try:
+            await self.database.create_collection(
+                self.collection_name, capped=True, size=self.size_bytes
+            )
+        except CollectionInvalid:
+            pass
+        await self.collection.create_index("seq")
+        if self._task is None:
+            latest = await self.collection.find_one(
+                {"seq": {"$exists": True}}, {"seq": 1}, sort=[("$natural", -1)]
+            )
+            self._task = asyncio.create_task(self._tail(latest["seq"] if latest else 0))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def publish(self, channel: str, message: dict):
+        await self._dispatch(channel, message)
+        counter = await self.database.counters.find_one_and_update(
+            {"_id": f"events:{self.collection_name}"},
+            {"$inc": {"seq": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        await self.collection.insert_one({
+            "seq": counter["seq"],
+            "origin": self.origin,
+            "channel": channel,
+            "message": message
+        })
+
+    async def _tail(self, low_water: int):
+        # low_water: every seq up to it has been seen; seen: later ones
+        seen: set = set()
+        while True:
+            try:
+                cursor = self.collection.find(
+                    {"seq": {"$gt": low_water}}, cursor_type=CursorType.TAILABLE_AWAIT
+                )
+                async for event in cursor:
+                    seq = event["seq"]
+                    if seq <= low_water or seq in seen:
+                        continue
+                    seen.add(seq)
+                    if len(seen) > self.MAX_PENDING_GAP:
+                        low_water = min(seen) - 1
+                    while low_water + 1 in seen:
+                        low_water += 1
+                        seen.discard(low_water)
+                    if event["origin"] != self.origin:
+                        await self._dispatch(event["channel"], event["message"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event bus tail failed: {e}")
+            # Tailable cursors die on an empty collection; reopen after a pause
+            await asyncio.sleep(1)
+
+def create_event_bus(backend: str) -> InMemoryEventBus:
+    if backend == "mongo":
+        return MongoEventBus(db, "ws_events", WS_EVENTS_COLLECTION_BYTES)
+    return InMemoryEventBus()
+
+ws_bus = create_event_bus(WS_PUBSUB_BACKEND)
+
+async def deliver_ws_event(channel: str, message: dict):
+    await ws_manager.broadcast(channel, message)
+
+ws_bus.subscribe(deliver_ws_event)
+
+class MatchChangeLog:
+    """Bounded per-competition log of sequenced match changes.
+
+    Lets a reconnecting client catch up from its last seen sequence number
+    instead of downloading every match again.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._logs: Dict[str, deque] = {}
+
+    def append(self, competition_id: str, changes: List[dict]):
+        log = self._logs.setdefault(competition_id, deque(maxlen=self.max_size))
+        log.extend(changes)
+
+    def since(self, competition_id: str, seq: int) -> Optional[List[dict]]:
+        """Changes after ``seq``, or None if the log cannot prove completeness"""
+        log = self._logs.get(competition_id)
+        if not log:
+            return None
+        changes = sorted(
+            (change for change in log if change["seq"] > seq),
+            key=lambda change: change["seq"]
+        )
+        latest = changes[-1]["seq"] if changes else max(change["seq"] for change in log)
+        if latest < seq or len({change["seq"] for change in changes}) != latest - seq:
+            return None
+        return changes
+
+match_change_log = MatchChangeLog(WS_CHANGE_LOG_SIZE)
+
+async def record_match_changes(channel: str, message: dict):
+    if "changes" in message:
+        match_change_log.append(channel, message["changes"])
+
+ws_bus.subscribe(record_match_changes)
+
+async def invalidate_match_responses(channel: str, message: dict):
+    # Sync, mock generation and finish_match all publish their changes here;
+    # standings tables are rewritten afterwards and announced separately
+    if "changes" in message or message.get("type") == "standings_updated":
+        response_cache.invalidate()
+
+ws_bus.subscribe(invalidate_match_responses)
+
+async def refresh_match_schedule(channel: str, message: dict):
+    for change in message.get("changes", []):
+        match_schedule.update(change["match"])
+
+ws_bus.subscribe(refresh_match_schedule)
+
+async def next_change_seq(competition_id: int, count: int = 1) -> int:
+    """Reserve ``count`` sequence numbers and return the last one"""
+    counter = await db.counters.find_one_and_update(
+        {"_id": f"match_changes:{competition_id}"},
+        {"$inc": {"seq": count}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return counter["seq"]
+
+async def current_change_seq(competition_id: int) -> int:
+    counter = await db.counters.find_one({"_id": f"match_changes:{competition_id}"})
+    return counter["seq"] if counter else 0
+
+async def publish_match_changes(competition_id: int, matches: List[dict], event_type: str):
+    """Number the changed matches and publish them to WebSocket clients.
+
+    Every match change gets the next sequence number of its competition;
+    the event carries the changes and the last sequence number so clients
+    can resume with ``?since=<seq>``.
+    """
+    last_seq = await next_change_seq(competition_id, len(matches))
+    first_seq = last_seq - len(matches) + 1
+    await ws_bus.publish(str(competition_id), {
+        "type": event_type,
+        "seq": last_seq,
+        "changes": [
+            {"seq": first_seq + offset, "match": match}
+            for offset, match in enumerate(matches)
+        ]
+    })
+
 @api_router.websocket("/ws/matches/{competition_id}")
-async def websocket_endpoint(websocket: WebSocket, competition_id: str):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    competition_id: str,
+    since: Optional[int] = None
+):
+    """Live match updates.
+
+    Clients that pass ``since`` (the last ``seq`` they saw) receive a
+    ``delta`` with only the changes they missed; otherwise, or when the
+    change log no longer reaches back that far, an ``initial`` snapshot.
+    Changes must be applied in ``seq`` order, ignoring any already seen.
+    """
     await ws_manager.connect(websocket, competition_id)
     try:
-        # Send initial matches
-        matches = await db.matches.find(
-            {"competition_id": int(competition_id)},
-            {"_id": 0}
-        ).sort("utc_date", 1).to_list(200)
-        await websocket.send_json({"type": "initial", "matches": matches})
+        changes = match_change_log.since(competition_id, since) if since is not None else None
+        if changes is not None:
+            await ws_manager.send(websocket, competition_id, {
+                "type": "delta",
+                "seq": changes[-1]["seq"] if changes else since,
+                "changes": changes
+            })
+        else:
+            # Read the sequence first so no change can fall between the two
+            seq = await current_change_seq(int(competition_id))
+            matches = await db.matches.find(
+                {"competition_id": int(competition_id)},
+                {"_id": 0}
+            ).sort("utc_date", 1).to_list(200)
+            await ws_manager.send(websocket, competition_id, {
+                "type": "initial",
+                "seq": seq,
+                "matches": matches
+            })
         
         while True:
             data = await websocket.receive_text()
@@ -885,44 +2547,229 @@ async def websocket_endpoint(websocket: WebSocket, competition_id: str):
 
 # ==================== POINTS CALCULATION ====================
 
-async def calculate_points(prediction: dict, match: dict) -> int:
-    """Calculate points for a prediction"""
-    if match["status"] != "FINISHED":
-        return 0
-    
-    pred_home = prediction["home_score"]
-    pred_away = prediction["away_score"]
-    actual_home = match["score"].get("home", 0) or 0
-    actual_away = match["score"].get("away", 0) or 0
-    
-    # Exact score = 4 points
-    if pred_home == actual_home and pred_away == actual_away:
-        return 4
-    
-    # Correct goal difference = 3 points
-    pred_diff = pred_home - pred_away
+def _tendency(home: int, away: int) -> str:
+    if home > away:
+        return "H"
+    elif home < away:
+        return "A"
+    return "D"
+
+def calculate_points_batch(
+    home_scores: Sequence[int],
+    away_scores: Sequence[int],
+    jokers: Sequence[bool],
+    actual_home: int,
+    actual_away: int
+) -> dict:
+    """Score a column of predictions against one match result.
+
+    Scoring rules: exact score 4, correct goal difference 3, correct
+    tendency 2, nothing otherwise; jokers double the points. Inputs may be
+    lists, ``array`` objects or NumPy arrays. Returns the final ``points``
+    and rule-level ``base_points`` arrays together with the number of exact
+    scores, goal differences and tendencies in the batch.
+    """
     actual_diff = actual_home - actual_away
-    if pred_diff == actual_diff:
-        return 3
-    
-    # Correct tendency = 2 points
-    def get_tendency(home, away):
-        if home > away:
-            return "H"
-        elif home < away:
-            return "A"
-        return "D"
-    
-    if get_tendency(pred_home, pred_away) == get_tendency(actual_home, actual_away):
-        return 2
-    
-    return 0
+    if np is not None:
+        home = np.asarray(home_scores, dtype=np.int64)
+        away = np.asarray(away_scores, dtype=np.int64)
+        joker = np.asarray(jokers, dtype=bool)
+        diff = home - away
+        exact = (home == actual_home) & (away == actual_away)
+        goal_diff = ~exact & (diff == actual_diff)
+        tendency = ~exact & ~goal_diff & (np.sign(diff) == np.sign(actual_diff))
+        base_points = np.select([exact, goal_diff, tendency], [4, 3, 2], 0)
+        return {
+            "points": base_points * np.where(joker, 2, 1),
+            "base_points": base_points,
+            "exact_scores": int(exact.sum()),
+            "goal_diffs": int(goal_diff.sum()),
+            "tendencies": int(tendency.sum())
+        }
+
+    actual_tendency = _tendency(actual_home, actual_away)
+    base_points = array("i")
+    points = array("i")
+    counts = {4: 0, 3: 0, 2: 0, 0: 0}
+    for home, away, joker in zip(home_scores, away_scores, jokers):
+        if home == actual_home and away == actual_away:
+            base = 4
+        elif home - away == actual_diff:
+            base = 3
+        elif _tendency(home, away) == actual_tendency:
+            base = 2
+        else:
+            base = 0
+        counts[base] += 1
+        base_points.append(base)
+        points.append(base * 2 if joker else base)
+    return {
+        "points": points,
+        "base_points": base_points,
+        "exact_scores": counts[4],
+        "goal_diffs": counts[3],
+        "tendencies": counts[2]
+    }
+
+_scoring_locks: Dict[int, asyncio.Lock] = {}
+
+async def score_match_predictions(
+    match: dict,
+    batch_size: int = SCORING_BATCH_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """Score every prediction for a match in batches; returns the number scored"""
+    async with _scoring_locks.setdefault(match["id"], asyncio.Lock()):
+        return await _score_match_predictions(match, batch_size, progress)
+
+async def _score_match_predictions(
+    match: dict,
+    batch_size: int,
+    progress: Optional[Callable[[int, int], None]]
+) -> int:
+    batch_size = max(batch_size, 1)
+    await prediction_write_buffer.flush(match_id=match["id"])
+    cursor = db.predictions.find(
+        {"match_id": match["id"]},
+        {"_id": 1, "user_id": 1, "home_score": 1, "away_score": 1,
+         "is_joker": 1, "points_earned": 1},
+        batch_size=batch_size
+    )
+    scored = 0
+    written = 0
+    batch = []
+
+    async def flush():
+        nonlocal scored, written
+        if match["status"] == "FINISHED":
+            result = calculate_points_batch(
+                array("i", (pred["home_score"] for pred in batch)),
+                array("i", (pred["away_score"] for pred in batch)),
+                array("b", (bool(pred.get("is_joker")) for pred in batch)),
+                match["score"].get("home", 0) or 0,
+                match["score"].get("away", 0) or 0
+            )
+            points = result["points"].tolist()
+            base_points = result["base_points"].tolist()
+        else:
+            points = base_points = [0] * len(batch)
+        ops = []
+        deltas: Dict[str, Dict[str, int]] = {}
+        for pred, final_points, base in zip(batch, points, base_points):
+            old_points = pred.get("points_earned") or 0
+            if final_points == old_points:
+                continue
+            ops.append(UpdateOne(
+                {"_id": pred["_id"]},
+                {"$set": {"points_earned": final_points}}
+            ))
+            delta = deltas.setdefault(
+                pred["user_id"], dict.fromkeys(LEADERBOARD_FIELDS, 0)
+            )
+            delta["total_points"] += final_points - old_points
+            old_base = old_points // 2 if pred.get("is_joker") else old_points
+            if old_base in BASE_POINTS_FIELDS:
+                delta[BASE_POINTS_FIELDS[old_base]] -= 1
+            if base in BASE_POINTS_FIELDS:
+                delta[BASE_POINTS_FIELDS[base]] += 1
+        user_ops = [
+            UpdateOne(
+                {"id": user_id},
+                {"$inc": {key: value for key, value in delta.items() if value}}
+            )
+            for user_id, delta in deltas.items()
+            if any(delta.values())
+        ]
+        if ops:
+            await db.predictions.bulk_write(ops, ordered=False)
+        if user_ops:
+            await db.users.bulk_write(user_ops, ordered=False)
+        scored += len(batch)
+        written += len(ops)
+        batch.clear()
+        logger.info(
+            f"Scoring match {match['id']}: {scored} scored, {written} updated"
+        )
+        if progress:
+            progress(scored, written)
+
+    async for pred in cursor:
+        batch.append(pred)
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    return scored
+
+class ScoringQueue:
+    """Bounded pool of workers that settle matches in the background.
+
+    A job re-scores the match's predictions and updates its group table.
+    Jobs are keyed by match id: a match that is already waiting is not queued
+    twice, and the scoring engine only writes point changes, so running the
+    same job again is harmless. Each job reads the current match document,
+    so a correction that arrives while a match is queued is picked up.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(workers, 1)
+        self.metrics = {"enqueued": 0, "completed": 0, "failed": 0, "queued": 0}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: set = set()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, match_id: int) -> bool:
+        if match_id in self._pending:
+            return False
+        self._pending.add(match_id)
+        self._queue.put_nowait(match_id)
+        self.metrics["enqueued"] += 1
+        self.metrics["queued"] = len(self._pending)
+        return True
+
+    async def join(self):
+        await self._queue.join()
+
+    async def _worker(self):
+        while True:
+            match_id = await self._queue.get()
+            # Allow a newer correction to queue this match again while we run
+            self._pending.discard(match_id)
+            self.metrics["queued"] = len(self._pending)
+            try:
+                match = await db.matches.find_one({"id": match_id}, {"_id": 0})
+                if match:
+                    scored = await score_match_predictions(match)
+                    await apply_standings_result(match)
+                    logger.info(f"Auto-scored match {match_id}: {scored} predictions")
+                self.metrics["completed"] += 1
+            except Exception as e:
+                self.metrics["failed"] += 1
+                logger.error(f"Scoring match {match_id} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+scoring_queue = ScoringQueue(SCORING_WORKERS)
 
 @api_router.post("/matches/{match_id}/finish")
 async def finish_match(
     match_id: int,
     home_score: int,
     away_score: int,
+    batch_size: int = SCORING_BATCH_SIZE,
     current_user: dict = Depends(get_current_user)
 ):
     """Admin endpoint to finish a match and calculate points"""
@@ -933,37 +2780,172 @@ async def finish_match(
             "status": "FINISHED",
             "score": {"home": home_score, "away": away_score},
             "last_updated": datetime.now(timezone.utc).isoformat()
-        }}
+        }, "$unset": {"fingerprint": ""}}
     )
     
     match = await db.matches.find_one({"id": match_id}, {"_id": 0})
+    if not match:
+        raise HTTPException(status_code=404, detail="Match not found")
     
     # Calculate points for all predictions
-    predictions = await db.predictions.find({"match_id": match_id}).to_list(10000)
-    
-    for pred in predictions:
-        points = await calculate_points(pred, match)
-        multiplier = 2 if pred.get("is_joker") else 1
-        final_points = points * multiplier
-        
-        await db.predictions.update_one(
-            {"id": pred["id"]},
-            {"$set": {"points_earned": final_points}}
-        )
+    scored = await score_match_predictions(match, batch_size=batch_size)
+    await apply_standings_result(match)
     
     # Broadcast update
-    await ws_manager.broadcast(str(match["competition_id"]), {
-        "type": "match_finished",
-        "match": match
-    })
+    await publish_match_changes(match["competition_id"], [match], "match_finished")
     
-    return {"message": f"Match finished. {len(predictions)} predictions scored."}
+    return {"message": f"Match finished. {scored} predictions scored."}
 
 # ==================== HEALTH CHECK ====================
 
 @api_router.get("/health")
 async def health_check():
-    return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
+    return {
+        "status": "ok",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "password_pool": password_hasher.metrics
+    }
+
+# ==================== METRICS ====================
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_COMMAND_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+class RequestMetrics:
+    """Per-route latency and DB round-trip metrics in Prometheus text format"""
+
+    def __init__(self):
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.db_commands_per_request: Dict[Tuple[str, str], Histogram] = {}
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.db_commands: Dict[Tuple[str, str], int] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float, commands: Dict[str, int]):
+        key = (method, route)
+        self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+        self.db_commands_per_request.setdefault(
+            key, Histogram(DB_COMMAND_BUCKETS)
+        ).observe(sum(commands.values()))
+        self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+        for command, count in commands.items():
+            self.db_commands[(route, command)] = self.db_commands.get((route, command), 0) + count
+
+    def render(self) -> str:
+        lines = []
+        self._render_histogram(
+            lines, "http_request_duration_seconds", "Request latency by route", self.latency
+        )
+        self._render_histogram(
+            lines, "http_request_db_commands", "MongoDB commands issued per request",
+            self.db_commands_per_request
+        )
+        lines.append("# HELP http_requests_total Requests by route and status")
+        lines.append("# TYPE http_requests_total counter")
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = _labels(method=method, route=route, status=status)
+            lines.append(f"http_requests_total{{{labels}}} {count}")
+        lines.append("# HELP mongodb_commands_total MongoDB commands by route and command")
+        lines.append("# TYPE mongodb_commands_total counter")
+        for (route, command), count in sorted(self.db_commands.items()):
+            lines.append(f"mongodb_commands_total{{{_labels(route=route, command=command)}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(self, lines: List[str], name: str, help_text: str, histograms: dict):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, route), histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                labels = _labels(method=method, route=route, le=bound)
+                lines.append(f"{name}_bucket{{{labels}}} {cumulative}")
+            labels = _labels(method=method, route=route, le="+Inf")
+            lines.append(f"{name}_bucket{{{labels}}} {histogram.count}")
+            labels = _labels(method=method, route=route)
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+def _labels(**labels) -> str:
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return ",".join(f'{key}="{escape(value)}"' for key, value in labels.items())
+
+request_metrics = RequestMetrics()
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request and counting its DB commands.
+
+    Requests are labelled with the matched route template (e.g.
+    ``/api/matches/{match_id}``) so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        commands: Dict[str, int] = {}
+        token = request_db_commands.set(commands)
+        status = 500
+        
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            request_metrics.record(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status,
+                time.perf_counter() - started,
+                commands
+            )
+            request_db_commands.reset(token)
+
+def component_metrics() -> Dict[str, dict]:
+    return {
+        "live_poller": live_poller.metrics,
+        "scoring_queue": scoring_queue.metrics,
+        "password_pool": password_hasher.metrics,
+        "response_cache": response_cache.metrics,
+        "match_schedule": match_schedule.metrics,
+        "prediction_writes": prediction_write_buffer.metrics,
+        "websocket": ws_manager.metrics,
+        "football_data": football_data.metrics,
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    lines = [request_metrics.render()]
+    for component, values in component_metrics().items():
+        for key, value in values.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append(f"kickpredict_{component}_{key} {value}\n")
+    return "".join(lines)
 
 # Include router
 app.include_router(api_router)
@@ -975,22 +2957,176 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
+app.add_middleware(MetricsMiddleware)
+
+# ==================== INDEXES ====================
+
+# (collection, keys, options) for every index the queries above rely on
+INDEXES = [
+    ("users", [("email", 1)], {"unique": True}),
+    ("users", [("username", 1)], {"unique": True}),
+    ("users", [("id", 1)], {"unique": True}),
+    # Leaderboard pages and rank counts only ever look at players with predictions
+    ("users", [("total_points", -1), ("id", 1)], {
+        "name": "leaderboard",
+        "partialFilterExpression": {"predictions_count": {"$gt": 0}}
+    }),
+    ("matches", [("id", 1)], {"unique": True}),
+    ("matches", [("competition_id", 1), ("utc_date", 1), ("id", 1)], {}),
+    ("matches", [("competition_id", 1), ("stage", 1), ("group", 1), ("status", 1),
+                 ("utc_date", 1), ("id", 1)], {}),
+    ("matches", [("status", 1), ("utc_date", 1)], {}),
+    ("predictions", [("user_id", 1), ("match_id", 1)], {"unique": True}),
+    ("predictions", [("match_id", 1), ("user_id", 1)], {}),
+    ("prediction_stats", [("match_id", 1)], {"unique": True}),
+    ("groups", [("code", 1)], {"unique": True}),
+    ("groups", [("id", 1)], {"unique": True}),
+    ("groups", [("members", 1)], {}),
+    ("standings", [("competition_id", 1), ("group", 1)], {"unique": True}),
+]
+
+# Representative hot queries checked by the index advisor
+QUERY_SHAPES = [
+    {"name": "leaderboard", "collection": "users",
+     "filter": {"predictions_count": {"$gt": 0}}, "sort": [("total_points", -1), ("id", 1)]},
+    {"name": "global_rank", "collection": "users",
+     "filter": {"predictions_count": {"$gt": 0}, "total_points": {"$gt": 0}}},
+    {"name": "match_list", "collection": "matches",
+     "filter": {"competition_id": 2000}, "sort": MATCH_LIST_SORT},
+    {"name": "match_list_filtered", "collection": "matches",
+     "filter": {"competition_id": 2000, "stage": "GROUP_STAGE", "group": "GROUP_A",
+                "status": "SCHEDULED"}, "sort": MATCH_LIST_SORT},
+    {"name": "live_matches", "collection": "matches",
+     "filter": {"status": {"$in": LIVE_STATUSES}}},
+    {"name": "next_kickoff", "collection": "matches",
+     "filter": {"status": {"$in": UPCOMING_STATUSES}, "utc_date": {"$gte": "2026-01-01"}},
+     "sort": [("utc_date", 1)]},
+    {"name": "finished_group_matches", "collection": "matches",
+     "filter": {"stage": "GROUP_STAGE", "status": "FINISHED"}},
+    {"name": "user_predictions", "collection": "predictions",
+     "filter": {"user_id": "a"}, "sort": [("match_id", 1)]},
+    {"name": "match_predictions", "collection": "predictions",
+     "filter": {"match_id": 1}, "sort": [("user_id", 1)]},
+    {"name": "my_groups", "collection": "groups", "filter": {"members": "a"}},
+    {"name": "dashboard_upcoming", "collection": "matches",
+     "filter": {"competition_id": 2000, "utc_date": {"$gte": "2026-01-01"}},
+     "sort": MATCH_LIST_SORT},
+    {"name": "match_prediction_stats", "collection": "prediction_stats",
+     "filter": {"match_id": 1}},
+    {"name": "standings", "collection": "standings",
+     "filter": {"competition_id": 2000}, "sort": [("group", 1)]},
+]
+
+async def ensure_indexes():
+    """Create the declared index set, replacing indexes whose options changed"""
+    for collection, keys, options in INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+        except OperationFailure as e:
+            # 85/86: an index on the same keys (or name) exists with other options
+            if e.code not in (85, 86):
+                raise
+            async for index in db[collection].list_indexes():
+                if list(index["key"].items()) == keys or index["name"] == options.get("name"):
+                    await db[collection].drop_index(index["name"])
+            await db[collection].create_index(keys, **options)
+
+def _plan_stages(plan: dict) -> List[str]:
+    stages = [plan.get("stage", "")]
+    for child in [plan.get("inputStage"), *plan.get("inputStages", [])]:
+        if child:
+            stages.extend(_plan_stages(child))
+    return stages
+
+async def advise_indexes() -> List[dict]:
+    """Explain every registered query shape and flag scans and in-memory sorts"""
+    report = []
+    for shape in QUERY_SHAPES:
+        command = {"find": shape["collection"], "filter": shape["filter"]}
+        if shape.get("sort"):
+            command["sort"] = dict(shape["sort"])
+        explained = await db.command({"explain": command, "verbosity": "queryPlanner"})
+        winning_plan = explained["queryPlanner"]["winningPlan"]
+        # Slot-based engine plans nest the classic tree under queryPlan
+        stages = _plan_stages(winning_plan.get("queryPlan", winning_plan))
+        report.append({
+            "name": shape["name"],
+            "collection": shape["collection"],
+            "stages": stages,
+            "collection_scan": "COLLSCAN" in stages,
+            "in_memory_sort": "SORT" in stages
+        })
+    for entry in report:
+        if entry["collection_scan"] or entry["in_memory_sort"]:
+            logger.warning(
+                f"Index advisor: {entry['name']} on {entry['collection']} uses "
+                f"{' > '.join(entry['stages'])}"
+            )
+    return report
+
+# ==================== MIGRATIONS ====================
+
+# (name, backfill) pairs run once per database, in order, on startup
+MIGRATIONS: List[Tuple[str, Callable[[], Awaitable]]] = [
+    # Users created before the materialized leaderboard have no totals
+    ("leaderboard_totals", rebuild_leaderboard_totals),
+    # Predictions saved before prediction_stats existed are not counted
+    ("prediction_stats", rebuild_prediction_stats),
+]
+
+async def run_migrations():
+    """Run each backfill whose marker is missing from ``counters``.
+
+    The marker is written after the backfill succeeds; backfills are
+    rebuilds, so a second worker racing through the same one is harmless.
+    """
+    for name, backfill in MIGRATIONS:
+        marker = f"migration:{name}"
+        if await db.counters.find_one({"_id": marker}):
+            continue
+        logger.info(f"Running migration {name}")
+        await backfill()
+        await db.counters.update_one(
+            {"_id": marker},
+            {"$set": {"applied_at": datetime.now(timezone.utc).isoformat()}},
+            upsert=True
+        )
 
 @app.on_event("startup")
 async def startup_db():
     # Create indexes
-    await db.users.create_index("email", unique=True)
-    await db.users.create_index("username", unique=True)
-    await db.users.create_index("id", unique=True)
-    await db.matches.create_index("id", unique=True)
-    await db.matches.create_index("competition_id")
-    await db.matches.create_index("stage")
-    await db.predictions.create_index([("user_id", 1), ("match_id", 1)], unique=True)
-    await db.groups.create_index("code", unique=True)
-    await db.groups.create_index("id", unique=True)
+    await ensure_indexes()
     logger.info("Database indexes created")
+    await run_migrations()
+    await match_schedule.load()
+    if os.environ.get('INDEX_ADVISOR_ON_STARTUP', 'false').lower() == 'true':
+        await advise_indexes()
+    await football_data.start()
+    await ws_bus.start()
+    scoring_queue.start()
+    prediction_write_buffer.start()
+    if LIVE_POLLER_ENABLED and FOOTBALL_DATA_API_KEY:
+        live_poller.start()
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await live_poller.stop()
+    await scoring_queue.stop()
+    await prediction_write_buffer.stop()
+    await ws_bus.stop()
+    await football_data.close()
+    password_hasher.shutdown()
     client.close()
+
+if __name__ == "__main__":
+    # python server.py --advise-indexes: create indexes, print the advisor
+    # report as JSON and exit non-zero if any query scans or sorts in memory
+    if "--advise-indexes" in sys.argv:
+        async def main():
+            await ensure_indexes()
+            return await advise_indexes()
+        report = asyncio.run(main())
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if any(e["collection_scan"] or e["in_memory_sort"] for e in report) else 0)
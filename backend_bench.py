@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+KickPredict Backend Benchmark Suite
+Seeds a local database, drives concurrent load against an in-process server
+and reports latency percentiles and throughput as JSON
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class KickPredictBenchmark:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.server = None
+        self.base_url = None
+        self.tokens: List[str] = []
+        self.user_ids: List[str] = []
+        self.open_match_ids: List[int] = []
+        self.predicted_match_ids: List[int] = []
+        self.rng = random.Random(args.seed)
+
+    # ==================== SETUP ====================
+
+    def load_server_module(self):
+        """Import backend/server.py against the benchmark database"""
+        os.environ["MONGO_URL"] = self.args.mongo_url
+        os.environ["DB_NAME"] = self.args.db_name
+        os.environ["LIVE_POLLER_ENABLED"] = "false"
+        os.environ["FOOTBALL_DATA_API_KEY"] = ""
+        sys.path.insert(0, str(Path(__file__).parent / "backend"))
+        import server
+        if self.args.mock:
+            # In-process stand-in for MongoDB, handy where mongod is unavailable
+            from mongomock_motor import AsyncMongoMockClient
+            server.db = AsyncMongoMockClient()[self.args.db_name]
+        self.server = server
+
+    async def start_app(self):
+        import uvicorn
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        config = uvicorn.Config(
+            self.server.app, host="127.0.0.1", port=port,
+            log_level="warning", lifespan="on"
+        )
+        self.uvicorn = uvicorn.Server(config)
+        self.uvicorn_task = asyncio.create_task(self.uvicorn.serve())
+        while not self.uvicorn.started:
+            await asyncio.sleep(0.05)
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop_app(self):
+        self.uvicorn.should_exit = True
+        await self.uvicorn_task
+
+    async def seed(self) -> Dict:
+        """Insert N users, M predictions and G groups on mock fixtures"""
+        server = self.server
+        db = server.db
+        started = time.perf_counter()
+        for collection in ("users", "predictions", "groups", "matches", "standings", "counters"):
+            await db[collection].delete_many({})
+
+        await server.generate_mock_matches()
+        matches = await db.matches.find({}, {"_id": 0, "id": 1}).to_list(None)
+        match_ids = [m["id"] for m in matches]
+        self.open_match_ids = match_ids
+
+        # bcrypt is deliberately slow; one hash serves every seeded user
+        password = server.hash_password("benchmark")
+        now = datetime.now(timezone.utc).isoformat()
+        users = []
+        for idx in range(self.args.users):
+            user_id = str(uuid.uuid4())
+            users.append({
+                "id": user_id,
+                "email": f"bench{idx}@example.com",
+                "username": f"bench{idx}",
+                "password": password,
+                "avatar": None,
+                "total_points": 0,
+                "exact_scores": 0,
+                "goal_diffs": 0,
+                "tendencies": 0,
+                "predictions_count": 0,
+                "created_at": now
+            })
+            self.user_ids.append(user_id)
+            self.tokens.append(server.create_token(user_id))
+        await self._insert_batches(db.users, users)
+
+        # Spread predictions over (match, user) pairs, busiest matches first
+        total = min(self.args.predictions, len(users) * len(match_ids))
+        predictions = []
+        for idx in range(total):
+            match_id = match_ids[idx // len(users)]
+            predictions.append({
+                "id": str(uuid.uuid4()),
+                "user_id": self.user_ids[idx % len(users)],
+                "match_id": match_id,
+                "home_score": self.rng.randint(0, 4),
+                "away_score": self.rng.randint(0, 4),
+                "is_joker": self.rng.random() < 0.1,
+                "points_earned": 0,
+                "created_at": now,
+                "updated_at": now
+            })
+        self.predicted_match_ids = sorted({p["match_id"] for p in predictions})
+        await self._insert_batches(db.predictions, predictions)
+
+        groups = []
+        for idx in range(self.args.groups):
+            members = self.rng.sample(self.user_ids, min(len(self.user_ids), self.args.group_size))
+            groups.append({
+                "id": str(uuid.uuid4()),
+                "name": f"Bench group {idx}",
+                "description": "",
+                "code": uuid.uuid4().hex[:8].upper(),
+                "owner_id": members[0],
+                "members": members,
+                "created_at": now
+            })
+        await self._insert_batches(db.groups, groups)
+        await server.rebuild_leaderboard_totals()
+        await server.rebuild_prediction_stats()
+
+        return {
+            "users": len(users),
+            "matches": len(match_ids),
+            "predictions": len(predictions),
+            "groups": len(groups),
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+
+    async def _insert_batches(self, collection, docs: List[dict], batch_size: int = 5000):
+        for start in range(0, len(docs), batch_size):
+            await collection.insert_many(docs[start:start + batch_size], ordered=False)
+
+    async def cleanup(self):
+        if not self.args.keep_data and not self.args.mock:
+            await self.server.client.drop_database(self.args.db_name)
+
+    # ==================== LOAD ====================
+
+    async def run_scenario(
+        self,
+        name: str,
+        requests: int,
+        concurrency: int,
+        call: Callable[[int], Awaitable[bool]]
+    ) -> Dict:
+        """Run ``requests`` calls with ``concurrency`` workers and summarize them"""
+        latencies: List[float] = []
+        errors = 0
+        counter = iter(range(requests))
+
+        async def worker():
+            nonlocal errors
+            for idx in counter:
+                started = time.perf_counter()
+                try:
+                    ok = await call(idx)
+                except Exception:
+                    ok = False
+                latencies.append(time.perf_counter() - started)
+                if not ok:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        result = {
+            "name": name,
+            "requests": len(latencies),
+            "errors": errors,
+            "concurrency": concurrency,
+            "seconds": round(elapsed, 3),
+            "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50) * 1000, 2),
+                "p90": round(percentile(latencies, 90) * 1000, 2),
+                "p99": round(percentile(latencies, 99) * 1000, 2),
+                "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+                "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0
+            }
+        }
+        print(
+            f"{name}: {result['throughput_rps']} req/s, p50 {result['latency_ms']['p50']} ms, "
+            f"p99 {result['latency_ms']['p99']} ms, {errors} errors",
+            file=sys.stderr
+        )
+        return result
+
+    def auth(self, idx: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[idx % len(self.tokens)]}"}
+
+    async def run_load(self) -> List[Dict]:
+        args = self.args
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        results = []
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=60.0) as http:
+
+            async def leaderboards(idx: int) -> bool:
+                response = await http.get("/api/leaderboards", params={"limit": 50})
+                return response.status_code == 200
+
+            async def profile(idx: int) -> bool:
+                response = await http.get("/api/users/profile", headers=self.auth(idx))
+                return response.status_code == 200
+
+            async def predictions(idx: int) -> bool:
+                response = await http.post("/api/predictions", headers=self.auth(idx), json={
+                    "match_id": self.rng.choice(self.open_match_ids),
+                    "home_score": self.rng.randint(0, 4),
+                    "away_score": self.rng.randint(0, 4),
+                    "is_joker": False
+                })
+                return response.status_code == 200
+
+            results.append(await self.run_scenario("leaderboards", args.requests, args.concurrency, leaderboards))
+            results.append(await self.run_scenario("users_profile", args.requests, args.concurrency, profile))
+            results.append(await self.run_scenario("predictions", args.requests, args.concurrency, predictions))
+            results.append(await self.run_websocket())
+
+            finish_ids = self.predicted_match_ids[:args.finish_matches]
+
+            async def finish(idx: int) -> bool:
+                response = await http.post(
+                    f"/api/matches/{finish_ids[idx]}/finish",
+                    params={"home_score": self.rng.randint(0, 3), "away_score": self.rng.randint(0, 3)},
+                    headers=self.auth(idx)
+                )
+                return response.status_code == 200
+
+            results.append(await self.run_scenario(
+                "finish_match", len(finish_ids), min(len(finish_ids), 4) or 1, finish
+            ))
+        return results
+
+    async def run_websocket(self) -> Dict:
+        """Time connect-to-first-message on /ws/matches"""
+        try:
+            import websockets
+        except ImportError:
+            return {"name": "websocket", "skipped": "websockets package not installed"}
+        url = self.base_url.replace("http://", "ws://") + "/api/ws/matches/2000"
+
+        async def connect(idx: int) -> bool:
+            async with websockets.connect(url, max_size=None) as ws:
+                message = json.loads(await ws.recv())
+                return message.get("type") in ("initial", "delta")
+
+        return await self.run_scenario(
+            "websocket", self.args.ws_connections, self.args.concurrency, connect
+        )
+
+    async def run(self) -> Dict:
+        self.load_server_module()
+        await self.start_app()
+        try:
+            seed = await self.seed()
+            print(f"Seeded {seed}", file=sys.stderr)
+            scenarios = await self.run_load()
+            return {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "config": {
+                    key: value for key, value in vars(self.args).items()
+                    if key not in ("output",)
+                },
+                "seed": seed,
+                "scenarios": scenarios
+            }
+        finally:
+            await self.cleanup()
+            await self.stop_app()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--predictions", type=int, default=20000)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--group-size", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500, help="requests per HTTP scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--ws-connections", type=int, default=200)
+    parser.add_argument("--finish-matches", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    parser.add_argument("--db-name", default="kickpredict_bench")
+    parser.add_argument("--mock", action="store_true", help="use mongomock-motor instead of MongoDB")
+    parser.add_argument("--keep-data", action="store_true", help="keep the benchmark database")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main benchmark runner"""
+    args = parse_args()
+    report = asyncio.run(KickPredictBenchmark(args).run())
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    print(output)
+    return 1 if any(s.get("errors") for s in report["scenarios"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
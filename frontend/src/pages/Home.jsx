@@ -44,23 +44,14 @@ const Home = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [statsRes, matchesRes, leaderboardRes] = await Promise.all([
-          axios.get(`${API}/users/${user.id}`),
-          axios.get(`${API}/matches`),
-          axios.get(`${API}/leaderboard`)
-        ]);
+        // Stats, upcoming/live matches and top predictors in one round trip
+        const { data } = await axios.get(`${API}/dashboard`, {
+          params: { matches: 3, top: 5 }
+        });
 
-        setStats(statsRes.data);
-        
-        // Filter for upcoming/live matches and sort by date
-        const now = new Date();
-        const upcoming = matchesRes.data
-          .filter(m => new Date(m.utc_date) > new Date(now.getTime() - 2 * 60 * 60 * 1000))
-          .sort((a, b) => new Date(a.utc_date) - new Date(b.utc_date))
-          .slice(0, 3);
-          
-        setUpcomingMatches(upcoming);
-        setLeaderboard(leaderboardRes.data.slice(0, 5));
+        setStats(data.stats);
+        setUpcomingMatches(data.upcoming_matches);
+        setLeaderboard(data.leaderboard);
       } catch (error) {
         console.error("Error fetching data:", error);
       } finally {
@@ -71,7 +62,7 @@ const Home = () => {
     if (user) fetchData();
   }, [user]);
 
-  const userRank = leaderboard.findIndex(u => u.id === user?.id) + 1;
+  const userRank = stats?.global_rank;
   const countPoints = useCountUp(stats?.total_points || 0);
 
   if (loading) {
@@ -151,9 +142,7 @@ const Home = () => {
                 <div className="space-y-1">
                   <div className="text-xs text-muted-foreground font-bold uppercase tracking-wider">Accuracy</div>
                   <div className="text-3xl font-bold text-white font-heading">
-                     {stats?.total_predictions > 0 
-                      ? Math.round((stats.correct_predictions / stats.total_predictions) * 100) 
-                      : 0}%
+                     {Math.round(stats?.accuracy || 0)}%
                   </div>
                 </div>
               </div>
@@ -166,9 +155,9 @@ const Home = () => {
       <section className="grid grid-cols-2 md:grid-cols-4 gap-4">
         {[
           { label: "Total Points", value: stats?.total_points || 0, icon: Star, color: "text-accent" },
-          { label: "Predictions", value: stats?.total_predictions || 0, icon: Activity, color: "text-blue-400" },
+          { label: "Predictions", value: stats?.predictions_count || 0, icon: Activity, color: "text-blue-400" },
           { label: "Perfect Scores", value: stats?.exact_scores || 0, icon: Trophy, color: "text-primary" },
-          { label: "Leagues", value: 3, icon: Users, color: "text-purple-400" },
+          { label: "Leagues", value: stats?.groups_count || 0, icon: Users, color: "text-purple-400" },
         ].map((stat, i) => (
           <div key={i} className="stat-card group">
             <div className={`p-2 rounded-xl bg-surface-raised mb-2 group-hover:scale-110 transition-transform duration-300 ${stat.color.replace('text-', 'bg-')}/10`}>
@@ -198,7 +187,7 @@ const Home = () => {
           <div className="space-y-4">
             {upcomingMatches.length > 0 ? (
               upcomingMatches.map(match => (
-                <MatchCard key={match.id} match={match} onPredictionSaved={() => {}} />
+                <MatchCard key={match.id} match={match} userPrediction={match.user_prediction} onPredictionSaved={() => {}} />
               ))
             ) : (
               <div className="p-8 rounded-2xl border border-white/5 bg-surface-raised/50 text-center space-y-3">
@@ -222,9 +211,9 @@ const Home = () => {
           <div className="bg-surface-raised/50 backdrop-blur-sm border border-white/5 rounded-2xl overflow-hidden">
             {leaderboard.map((player, index) => (
               <div 
-                key={player.id} 
+                key={player.user_id} 
                 className={`flex items-center justify-between p-4 border-b border-white/5 last:border-0 hover:bg-white/5 transition-colors ${
-                  player.id === user.id ? "bg-primary/5" : ""
+                  player.user_id === user.id ? "bg-primary/5" : ""
                 }`}
               >
                 <div className="flex items-center gap-3">
@@ -238,7 +227,7 @@ const Home = () => {
                   </div>
                   <div className="font-bold text-sm text-white">
                     {player.username}
-                    {player.id === user.id && <span className="ml-2 text-[10px] text-primary bg-primary/10 px-1.5 py-0.5 rounded border border-primary/20">YOU</span>}
+                    {player.user_id === user.id && <span className="ml-2 text-[10px] text-primary bg-primary/10 px-1.5 py-0.5 rounded border border-primary/20">YOU</span>}
                   </div>
                 </div>
                 <div className="font-heading font-bold text-accent">{player.total_points} <span className="text-[10px] text-muted-foreground font-sans">PTS</span></div>
@@ -0,0 +1,11 @@
+import os
+import sys
+from pathlib import Path
+
+# server.py reads its Mongo settings at import time; no connection is made
+# until a query runs, so unit tests never need a database
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "kickpredict_test")
+os.environ.setdefault("LIVE_POLLER_ENABLED", "false")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,52 @@
+import server
+
+
+def changes(*seqs):
+    return [{"seq": seq, "match": {"id": seq}} for seq in seqs]
+
+
+def test_since_returns_changes_after_seq_in_order():
+    log = server.MatchChangeLog(10)
+    log.append("2000", changes(1, 2))
+    log.append("2000", changes(4, 3))
+
+    assert [change["seq"] for change in log.since("2000", 1)] == [2, 3, 4]
+
+
+def test_since_up_to_date_client_gets_nothing():
+    log = server.MatchChangeLog(10)
+    log.append("2000", changes(1, 2, 3))
+
+    assert log.since("2000", 3) == []
+
+
+def test_since_unknown_competition_needs_full_state():
+    log = server.MatchChangeLog(10)
+    log.append("2000", changes(1))
+
+    assert log.since("2001", 0) is None
+
+
+def test_since_gap_in_log_needs_full_state():
+    log = server.MatchChangeLog(10)
+    # seq 3 was delivered to another worker's log only
+    log.append("2000", changes(1, 2, 4))
+
+    assert log.since("2000", 1) is None
+    assert [change["seq"] for change in log.since("2000", 3)] == [4]
+
+
+def test_since_trimmed_log_needs_full_state():
+    log = server.MatchChangeLog(3)
+    log.append("2000", changes(1, 2, 3, 4, 5))
+
+    assert log.since("2000", 1) is None
+    assert [change["seq"] for change in log.since("2000", 2)] == [3, 4, 5]
+
+
+def test_since_seq_ahead_of_log_needs_full_state():
+    log = server.MatchChangeLog(10)
+    log.append("2000", changes(1, 2))
+
+    # e.g. the client last talked to a worker that saw more changes
+    assert log.since("2000", 5) is None
@@ -0,0 +1,44 @@
+import asyncio
+
+import httpx
+
+import server
+
+
+def make_client(handler):
+    return server.FootballDataClient(
+        "https://football.test/v4", "key",
+        requests_per_minute=600,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+def test_get_returns_none_on_invalid_json():
+    client = make_client(lambda request: httpx.Response(200, text="<html>maintenance</html>"))
+
+    async def run():
+        try:
+            return await client.get("/competitions/2000/matches")
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()) is None
+    assert client.metrics["errors"] == 1
+
+
+def test_get_serves_not_modified_from_validators():
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"matches": [1]}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+
+    async def run():
+        try:
+            return [await client.get("/matches"), await client.get("/matches")]
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()) == [{"matches": [1]}, {"matches": [1]}]
+    assert client.metrics["not_modified"] == 1
@@ -0,0 +1,84 @@
+import asyncio
+
+import server
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeMatches:
+    def __init__(self, matches):
+        self.matches = {match["id"]: match for match in matches}
+        self.reads = 0
+
+    async def find_one(self, query, projection=None):
+        self.reads += 1
+        return self.matches.get(query["id"])
+
+    async def _iterate(self, ids):
+        for match_id in ids:
+            if match_id in self.matches:
+                yield self.matches[match_id]
+
+    def find(self, query, projection=None):
+        self.reads += 1
+        return self._iterate(query["id"]["$in"])
+
+
+class FakeDB:
+    def __init__(self, matches):
+        self.matches = FakeMatches(matches)
+
+
+def match(match_id, utc_date, status="TIMED"):
+    return {"id": match_id, "utc_date": utc_date, "status": status, "competition_id": 2000}
+
+
+def setup(monkeypatch, *matches):
+    clock = Clock()
+    fake = FakeDB(matches)
+    monkeypatch.setattr(server.time, "monotonic", clock)
+    monkeypatch.setattr(server, "db", fake)
+    return clock, fake, server.MatchSchedule(ttl=60)
+
+
+def test_get_rereads_expired_entry(monkeypatch):
+    clock, fake, schedule = setup(monkeypatch, match(1, "2026-06-11T19:00:00Z"))
+
+    asyncio.run(schedule.get(1))
+    asyncio.run(schedule.get(1))
+    assert fake.matches.reads == 1
+
+    # Rescheduled by another worker whose change event this one never saw
+    fake.matches.matches[1] = match(1, "2026-06-12T19:00:00Z")
+    clock.now += 61
+    entry = asyncio.run(schedule.get(1))
+
+    assert fake.matches.reads == 2
+    assert entry["kickoff"].day == 12
+    assert schedule.metrics["hits"] == 1
+    assert schedule.metrics["misses"] == 2
+
+
+def test_get_many_reads_only_expired_and_unknown(monkeypatch):
+    clock, fake, schedule = setup(
+        monkeypatch,
+        match(1, "2026-06-11T19:00:00Z"),
+        match(2, "2026-06-12T19:00:00Z"),
+        match(3, "2026-06-13T19:00:00Z"),
+    )
+    schedule.update(fake.matches.matches[1])
+    clock.now += 61
+    schedule.update(fake.matches.matches[2])
+
+    entries = asyncio.run(schedule.get_many([1, 2, 3]))
+
+    assert sorted(entries) == [1, 2, 3]
+    assert fake.matches.reads == 1
+    assert schedule.metrics["hits"] == 1
+    assert schedule.metrics["misses"] == 2
@@ -0,0 +1,62 @@
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+SORT = [("match_id", 1), ("id", 1)]
+
+
+def raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    cursor = server.encode_cursor([2000, "a1b2", None, 1.5])
+
+    assert server.decode_cursor(cursor) == [2000, "a1b2", None, 1.5]
+
+
+@pytest.mark.parametrize("payload", [
+    [{"$ne": None}, 0],
+    [[1, 2], "x"],
+    {"match_id": 1},
+    "not-a-list",
+])
+def test_decode_cursor_rejects_non_scalars(payload):
+    with pytest.raises(HTTPException) as exc:
+        server.decode_cursor(raw_cursor(payload))
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("cursor", ["%%%", raw_cursor([1])[:-1] + "!", "bm90IGpzb24"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(HTTPException) as exc:
+        server.decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_keyset_query_without_cursor_is_unchanged():
+    query = {"user_id": "u1"}
+
+    assert server.keyset_query(query, SORT, None) is query
+
+
+def test_keyset_query_rejects_wrong_length():
+    with pytest.raises(HTTPException) as exc:
+        server.keyset_query({}, SORT, server.encode_cursor([1]))
+    assert exc.value.status_code == 400
+
+
+def test_keyset_query_after_cursor():
+    query = server.keyset_query({"user_id": "u1"}, SORT, server.encode_cursor([7, "p9"]))
+
+    assert query == {"$and": [
+        {"user_id": "u1"},
+        {"$or": [
+            {"match_id": {"$gt": 7}},
+            {"match_id": 7, "id": {"$gt": "p9"}},
+        ]},
+    ]}
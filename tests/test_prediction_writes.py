@@ -0,0 +1,152 @@
+import asyncio
+import copy
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+
+
+class FakeCollection:
+    """Just enough of a Motor collection for the prediction write path"""
+
+    def __init__(self):
+        self.docs = []
+        self.failures = 0
+        # Apply the operations before failing, like a lost acknowledgement
+        self.fail_after_write = False
+
+    def _matching(self, query):
+        return [doc for doc in self.docs if all(doc.get(k) == v for k, v in query.items())]
+
+    async def _iterate(self, docs):
+        for doc in docs:
+            yield copy.deepcopy(doc)
+
+    def find(self, query, projection=None):
+        found = []
+        for clause in query["$or"]:
+            found.extend(self._matching(clause))
+        return self._iterate(found)
+
+    async def bulk_write(self, ops, ordered=True):
+        if self.failures and not self.fail_after_write:
+            self.failures -= 1
+            raise RuntimeError("write failed")
+        for op in ops:
+            matching = self._matching(op._filter)
+            if matching:
+                doc = matching[0]
+            elif op._upsert:
+                doc = dict(op._filter)
+                self.docs.append(doc)
+            else:
+                continue
+            doc.update(op._doc.get("$set", {}))
+            for field, value in op._doc.get("$inc", {}).items():
+                doc[field] = doc.get(field, 0) + value
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("write failed")
+
+
+class FakeDB:
+    def __init__(self):
+        self.predictions = FakeCollection()
+        self.users = FakeCollection()
+        self.prediction_stats = FakeCollection()
+        self.users.docs.append({"id": "u1", "predictions_count": 0})
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(server, "db", fake)
+    return fake
+
+
+def prediction(home, away, joker=False):
+    return {
+        "id": "p1", "user_id": "u1", "match_id": 7,
+        "home_score": home, "away_score": away, "is_joker": joker,
+        "points_earned": 0, "created_at": "t", "updated_at": "t"
+    }
+
+
+LOCK_TIMES = {7: datetime.now(timezone.utc) + timedelta(hours=1)}
+
+
+def counters(fake):
+    stats = fake.prediction_stats.docs[0] if fake.prediction_stats.docs else {}
+    return fake.users.docs[0]["predictions_count"], stats
+
+
+def test_failed_counter_update_is_retried_on_its_own(fake_db):
+    async def scenario():
+        buffer = server.PredictionWriteBuffer(0)
+        fake_db.users.failures = 1
+
+        await buffer.submit([prediction(2, 1)], LOCK_TIMES)
+        assert len(fake_db.predictions.docs) == 1
+        assert buffer.metrics["errors"] == 1
+        assert counters(fake_db)[0] == 0
+
+        await buffer.flush()
+        # An edit of the same prediction changes the stats but not the count
+        await buffer.submit([prediction(0, 0, joker=True)], LOCK_TIMES)
+        return buffer
+
+    buffer = asyncio.run(scenario())
+
+    count, stats = counters(fake_db)
+    assert count == 1
+    assert stats["count"] == 1
+    assert stats["draws"] == 1
+    assert stats["jokers"] == 1
+    assert not stats.get("home_wins")
+    assert not buffer._counters
+
+
+def test_retried_upsert_diffs_against_state_before_first_attempt(fake_db):
+    async def scenario():
+        buffer = server.PredictionWriteBuffer(60)
+        buffer.start()
+        try:
+            fake_db.predictions.failures = 1
+            fake_db.predictions.fail_after_write = True
+            await buffer.submit([prediction(1, 0)], LOCK_TIMES)
+
+            with pytest.raises(RuntimeError):
+                await buffer.flush()
+            assert buffer.get("u1", 7)["home_score"] == 1
+
+            await buffer.flush()
+        finally:
+            await buffer.stop()
+        return buffer
+
+    buffer = asyncio.run(scenario())
+
+    count, stats = counters(fake_db)
+    assert count == 1
+    assert stats["count"] == 1
+    assert stats["home_wins"] == 1
+    assert not buffer._stored
+
+
+def test_rebuild_discards_queued_updates(fake_db):
+    async def scenario():
+        buffer = server.PredictionWriteBuffer(0)
+        fake_db.users.failures = 1
+        await buffer.submit([prediction(2, 1)], LOCK_TIMES)
+        return buffer
+
+    buffer = asyncio.run(scenario())
+    assert [collection for collection, _ in buffer._counters] == ["users", "prediction_stats"]
+
+    buffer.discard_counters("prediction_stats")
+
+    assert [collection for collection, _ in buffer._counters] == ["users"]
@@ -0,0 +1,34 @@
+import server
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(server.time, "monotonic", clock)
+    cache = server.ResponseCache(10, ttl=5)
+
+    entry = cache.set("/api/standings?", b"[]", {}, cache.generation)
+    clock.now += 4.9
+    assert cache.get("/api/standings?") == entry
+
+    clock.now += 0.2
+    assert cache.get("/api/standings?") is None
+    assert "/api/standings?" not in cache._entries
+
+
+def test_results_loaded_before_invalidate_are_not_stored():
+    cache = server.ResponseCache(10, ttl=5)
+    generation = cache.generation
+
+    cache.invalidate()
+    body, etag, _ = cache.set("/api/matches?", b"[1]", {}, generation)
+
+    assert body == b"[1]" and etag
+    assert cache.get("/api/matches?") is None
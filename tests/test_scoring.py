@@ -0,0 +1,71 @@
+from array import array
+
+import pytest
+
+import server
+
+# (predicted home, predicted away, joker, expected points) against a 2-1 result
+CASES = [
+    (2, 1, False, 4),   # exact score
+    (2, 1, True, 8),    # exact score, joker doubled
+    (3, 2, False, 3),   # same goal difference
+    (1, 0, True, 6),    # same goal difference, joker
+    (4, 0, False, 2),   # right tendency only
+    (1, 1, False, 0),   # draw predicted
+    (0, 2, True, 0),    # wrong winner, joker doubles nothing
+]
+
+
+@pytest.fixture(params=["numpy", "array"])
+def scoring_backend(request, monkeypatch):
+    if request.param == "numpy":
+        if server.np is None:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(server, "np", None)
+    return request.param
+
+
+def test_calculate_points_batch_rules(scoring_backend):
+    home = array("i", [case[0] for case in CASES])
+    away = array("i", [case[1] for case in CASES])
+    jokers = array("b", [case[2] for case in CASES])
+
+    result = server.calculate_points_batch(home, away, jokers, 2, 1)
+
+    assert list(result["points"]) == [case[3] for case in CASES]
+    assert list(result["base_points"]) == [4, 4, 3, 3, 2, 0, 0]
+    assert result["exact_scores"] == 2
+    assert result["goal_diffs"] == 2
+    assert result["tendencies"] == 1
+
+
+def test_calculate_points_batch_draw_result(scoring_backend):
+    result = server.calculate_points_batch([1, 0, 3, 2], [1, 0, 3, 0], [False] * 4, 1, 1)
+
+    # 0-0 and 3-3 share the goal difference of a 1-1 draw
+    assert list(result["points"]) == [4, 3, 3, 0]
+    assert result["tendencies"] == 0
+
+
+def test_calculate_points_batch_backends_agree(monkeypatch):
+    if server.np is None:
+        pytest.skip("numpy not installed")
+    home = [h for h in range(5) for _ in range(5)]
+    away = [a for _ in range(5) for a in range(5)]
+    jokers = [idx % 3 == 0 for idx in range(25)]
+
+    vectorized = server.calculate_points_batch(home, away, jokers, 3, 1)
+    monkeypatch.setattr(server, "np", None)
+    fallback = server.calculate_points_batch(home, away, jokers, 3, 1)
+
+    assert list(vectorized["points"]) == list(fallback["points"])
+    for key in ("exact_scores", "goal_diffs", "tendencies"):
+        assert vectorized[key] == fallback[key]
+
+
+def test_calculate_points_batch_empty(scoring_backend):
+    result = server.calculate_points_batch([], [], [], 0, 0)
+
+    assert list(result["points"]) == []
+    assert result["exact_scores"] == result["goal_diffs"] == result["tendencies"] == 0
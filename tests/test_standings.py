@@ -0,0 +1,158 @@
+import asyncio
+import copy
+
+import pytest
+
+import server
+
+
+def result(home, away, home_score, away_score):
+    return {"home": home, "away": away, "home_score": home_score, "away_score": away_score}
+
+
+def build(results):
+    teams = {}
+    for entry in results.values():
+        server._apply_result(teams, entry, 1)
+    return teams
+
+
+def ranking(results):
+    return [row["team"] for row in server._rank_teams(build(results), results)]
+
+
+def test_head_to_head_breaks_overall_tie():
+    results = {
+        "1": result("Argentina", "Brazil", 0, 1),
+        "2": result("Argentina", "Croatia", 0, 0),
+        "3": result("Argentina", "Denmark", 1, 0),
+        "4": result("Brazil", "Croatia", 0, 0),
+        "5": result("Brazil", "Denmark", 0, 1),
+        "6": result("Croatia", "Denmark", 1, 0),
+    }
+    teams = build(results)
+    # Argentina and Brazil are level on points, goal difference and goals
+    assert {k: teams["Argentina"][k] for k in ("points", "goal_diff", "goals_for")} == \
+        {k: teams["Brazil"][k] for k in ("points", "goal_diff", "goals_for")}
+
+    assert ranking(results) == ["Croatia", "Brazil", "Argentina", "Denmark"]
+
+
+def test_level_head_to_head_falls_back_to_name():
+    results = {
+        "1": result("Ecuador", "Qatar", 1, 1),
+        "2": result("Senegal", "Netherlands", 0, 2),
+    }
+
+    assert ranking(results) == ["Netherlands", "Ecuador", "Qatar", "Senegal"]
+
+
+def test_cyclic_head_to_head_falls_back_to_name():
+    results = {
+        "1": result("Wales", "England", 1, 0),
+        "2": result("England", "Iran", 1, 0),
+        "3": result("Iran", "Wales", 1, 0),
+    }
+
+    assert ranking(results) == ["England", "Iran", "Wales"]
+
+
+def test_apply_then_revert_leaves_no_rows():
+    teams = {}
+    entry = result("Spain", "Japan", 1, 2)
+
+    server._apply_result(teams, entry, 1)
+    server._apply_result(teams, entry, -1)
+
+    assert teams == {}
+
+
+class FakeStandings:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def find_one(self, query, projection=None):
+        for doc in self.docs:
+            if doc["competition_id"] == query["competition_id"] and doc["group"] == query["group"]:
+                return copy.deepcopy(doc)
+        return None
+
+    async def replace_one(self, query, replacement, upsert=False):
+        self.docs = [
+            doc for doc in self.docs
+            if (doc["competition_id"], doc["group"]) != (query["competition_id"], query["group"])
+        ]
+        self.docs.append(copy.deepcopy(replacement))
+
+
+class FakeDB:
+    def __init__(self, docs):
+        self.standings = FakeStandings(docs)
+
+
+def group_match(match_id, home, away, score, status="FINISHED"):
+    return {
+        "id": match_id,
+        "competition_id": 2000,
+        "stage": "GROUP_STAGE",
+        "group": "GROUP_E",
+        "status": status,
+        "home_team": {"name": home},
+        "away_team": {"name": away},
+        "score": score,
+    }
+
+
+@pytest.fixture
+def standings_db(monkeypatch):
+    first = group_match(1, "Spain", "Costa Rica", {"home": 7, "away": 0})
+    doc = server._empty_standings(first, "E")
+    doc["results"]["1"] = server._standings_result(first)
+    server._apply_result(doc["teams"], doc["results"]["1"], 1)
+    doc["table"] = server._rank_teams(doc["teams"], doc["results"])
+
+    fake = FakeDB([doc])
+    published = []
+
+    async def publish(competition_id):
+        published.append(competition_id)
+
+    monkeypatch.setattr(server, "db", fake)
+    monkeypatch.setattr(server, "publish_standings_update", publish)
+    fake.published = published
+    return fake
+
+
+def stored_table(fake):
+    return {row["team"]: row for row in fake.standings.docs[0]["table"]}
+
+
+def test_corrected_score_replaces_previous_result(standings_db):
+    corrected = group_match(1, "Spain", "Costa Rica", {"home": 1, "away": 2})
+
+    asyncio.run(server.apply_standings_result(corrected))
+
+    table = stored_table(standings_db)
+    assert table["Costa Rica"]["points"] == 3
+    assert table["Costa Rica"]["played"] == 1
+    assert table["Spain"]["points"] == 0
+    assert table["Spain"]["goals_for"] == 1
+    assert list(table) == ["Costa Rica", "Spain"]
+    assert standings_db.published == [2000]
+
+
+def test_reverted_result_removes_teams(standings_db):
+    reopened = group_match(1, "Spain", "Costa Rica", {"home": None, "away": None}, status="IN_PLAY")
+
+    asyncio.run(server.apply_standings_result(reopened))
+
+    assert standings_db.standings.docs[0]["results"] == {}
+    assert standings_db.standings.docs[0]["table"] == []
+
+
+def test_unchanged_result_is_not_rewritten(standings_db):
+    same = group_match(1, "Spain", "Costa Rica", {"home": 7, "away": 0})
+
+    asyncio.run(server.apply_standings_result(same))
+
+    assert standings_db.published == []